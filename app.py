@@ -1,8 +1,20 @@
+import logging
+
 import dash
 import dash_bootstrap_components as dbc
 from dash import Dash, dcc, html
 
-from flask_caching import Cache
+from flask import Response, jsonify
+
+from painel import aquecimento
+from painel.cache import configurar_cache, estatisticas_cache
+from painel.cursos import CURSOS
+from painel.dados import ao_recarregar, obter_dados, observar_arquivos
+from painel.metricas import configurar_metricas, texto_prometheus
+from painel.respostas import configurar_respostas, url_asset
+
+# Logs de carga dos dados (tempo e memória) e demais mensagens do painel
+logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
 
 app = Dash(
     __name__,
@@ -11,19 +23,53 @@ app = Dash(
     external_stylesheets=[dbc.themes.BOOTSTRAP, dbc.icons.FONT_AWESOME],
 )
 
-# Configuração do cache com Flask-Caching
-cache = Cache(app.server, config={
-    'CACHE_TYPE': 'SimpleCache',  # Cache em memória simples
-    'CACHE_DEFAULT_TIMEOUT': 60  # Tempo de expiração do cache em segundos (300 segundos = 5 minutos)
-})
+# Configuração do cache com Flask-Caching, compartilhado entre os workers
+# (backend, diretório, TTL e limite de entradas em painel/cache.py)
+cache = configurar_cache(app.server)
 
 server = app.server
 
+# Compressão gzip/brotli das respostas e cache longo dos assets com impressão digital
+# (codificações e tamanho mínimo em painel/respostas.py)
+configurar_respostas(server)
+
+# Tempos por callback e etapa e tamanho das respostas (PAINEL_METRICAS, painel/metricas.py)
+configurar_metricas(server)
+
+
+# Aquecimento do cache de figuras em segundo plano (estados em cada página, PAINEL_AQUECIMENTO)
+aquecimento.aquecer_em_segundo_plano()
+
+# Recarga dos CSVs sem reiniciar (PAINEL_RECARGA_INTERVALO): a versão nova entra na chave das
+# figuras e é aquecida como na subida
+ao_recarregar(lambda _: aquecimento.aquecer_em_segundo_plano())
+observar_arquivos()
+
+
+# Acertos/faltas dos caches de figuras, para acompanhar a taxa de acerto em uso real
+@server.route('/estatisticas/cache')
+def rota_estatisticas_cache():
+    return jsonify(estatisticas_cache())
+
+
+# Duração e figuras montadas no último aquecimento deste worker
+@server.route('/estatisticas/aquecimento')
+def rota_estatisticas_aquecimento():
+    return jsonify(aquecimento.relatorio)
+
+
+# As mesmas contagens e os tempos por callback/etapa no formato texto do Prometheus
+@server.route('/metrics')
+def rota_metricas():
+    return Response(texto_prometheus(estatisticas_cache(), obter_dados()),
+                    content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
 # sidebar
 sidebar = html.Div(
     [
         dbc.Row(
-            [html.Img(src='assets/logos/bed.png', style={'height': '20px'})],
+            [html.Img(src=url_asset(app, 'logos/bed.png'), style={'height': '20px'})],
             className='sidebar-logo',
         ),
         html.Hr(),
@@ -43,48 +89,23 @@ sidebar = html.Div(
                     href='/visaogeral',
                     active='exact'
                 ),
-                dbc.NavLink([
-                    html.I(id='icone-gcn',
-                           className='fa-solid fa-briefcase nav-icon',
-                           ),
-                    dbc.Tooltip(
-                        'Gestão e Controle de Negócios',
-                        target='icone-gcn',
-                        placement='right',
-                        style={'font-size': '1rem'}
-                    ),
+                *[
+                    dbc.NavLink([
+                        html.I(id=f'icone-{curso.sigla}',
+                               className=f'fa-solid {curso.icone} nav-icon',
+                               ),
+                        dbc.Tooltip(
+                            curso.nome,
+                            target=f'icone-{curso.sigla}',
+                            placement='right',
+                            style={'font-size': '1rem'}
+                        ),
+                    ],
+                        href=curso.caminho,
+                        active='exact'
+                    )
+                    for curso in CURSOS
                 ],
-                    href='/gcn',
-                    active='exact'
-                ),
-                dbc.NavLink([
-                    html.I(id='icone-grh',
-                           className='fa-solid fa-users nav-icon',
-                           ),
-                    dbc.Tooltip(
-                        'Gestão de Recursos Humanos',
-                        target='icone-grh',
-                        placement='right',
-                        style={'font-size': '1rem'}
-                    ),
-                ],
-                    href='/grh',
-                    active='exact'
-                ),
-                dbc.NavLink([
-                    html.I(id='icone-qtc',
-                           className='fa-solid fa-bacon nav-icon',
-                           ),
-                    dbc.Tooltip(
-                        'Qualidade e Tecnologias da carne',
-                        target='icone-qtc',
-                        placement='right',
-                        style={'font-size': '1rem'}
-                    ),
-                ],
-                    href='/qtc',
-                    active='exact'
-                ),
             ],
             vertical=True,
             pills=True,
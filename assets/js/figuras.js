@@ -0,0 +1,51 @@
+// Expande no navegador as figuras compactas de painel/serializacao.py.
+// Typed arrays ({dtype, bdata}) são lidos pelo próprio plotly.js; aqui só o customdata
+// codificado por dicionário ({categorias, codigos}) volta a ser uma matriz de valores.
+window.dash_clientside = window.dash_clientside || {};
+
+(function () {
+    var TIPOS = {i2: Int16Array, i4: Int32Array};
+
+    function decodificar(typed) {
+        var binario = atob(typed.bdata);
+        var bytes = new Uint8Array(binario.length);
+        for (var i = 0; i < binario.length; i++) {
+            bytes[i] = binario.charCodeAt(i);
+        }
+        return new TIPOS[typed.dtype](bytes.buffer);
+    }
+
+    function expandirCustomdata(customdata) {
+        var codigos = decodificar(customdata.codigos);
+        var categorias = customdata.categorias;
+        var colunas = categorias.length;
+        var linhas = codigos.length / colunas;
+        var umaColuna = String(customdata.codigos.shape).indexOf(',') < 0;
+        var saida = new Array(linhas);
+        for (var i = 0; i < linhas; i++) {
+            var linha = new Array(colunas);
+            for (var j = 0; j < colunas; j++) {
+                var codigo = codigos[i * colunas + j];
+                linha[j] = codigo < 0 ? null : categorias[j][codigo];
+            }
+            saida[i] = umaColuna ? linha[0] : linha;
+        }
+        return saida;
+    }
+
+    window.dash_clientside.painel = Object.assign({}, window.dash_clientside.painel, {
+        expandir_figura: function (figura) {
+            if (!figura) {
+                return window.dash_clientside.no_update;
+            }
+            // Cópia rasa: o conteúdo do dcc.Store não é alterado
+            var traces = figura.data.map(function (trace) {
+                if (trace.customdata && trace.customdata.categorias) {
+                    return Object.assign({}, trace, {customdata: expandirCustomdata(trace.customdata)});
+                }
+                return trace;
+            });
+            return Object.assign({}, figura, {data: traces});
+        }
+    });
+})();
@@ -0,0 +1,26 @@
+// Visão Geral: troca Dias/Semanas/Meses no navegador. O servidor entrega as três figuras
+// de produção (já filtradas pelos cursos) num dcc.Store; aqui só se escolhe qual mostrar.
+window.dash_clientside = window.dash_clientside || {};
+
+(function () {
+    var PERIODOS = ['dia', 'semana', 'mes'];
+
+    window.dash_clientside.painel = Object.assign({}, window.dash_clientside.painel, {
+        alternar_periodo: function (figuras, diaClicks, semanaClicks, mesClicks, semanaAtivo, mesAtivo) {
+            var periodo = semanaAtivo ? 'semana' : (mesAtivo ? 'mes' : 'dia');
+            var disparos = window.dash_clientside.callback_context.triggered.map(function (disparo) {
+                return disparo.prop_id.split('.')[0];
+            });
+            PERIODOS.forEach(function (candidato) {
+                if (disparos.indexOf('btn-' + candidato) >= 0) {
+                    periodo = candidato;
+                }
+            });
+
+            var figura = figuras && figuras[periodo]
+                ? window.dash_clientside.painel.expandir_figura(figuras[periodo])
+                : window.dash_clientside.no_update;
+            return [figura, periodo === 'dia', periodo === 'semana', periodo === 'mes'];
+        }
+    });
+})();
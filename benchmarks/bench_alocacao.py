@@ -0,0 +1,73 @@
+"""Memória alocada por requisição nos callbacks dos cursos: pico do tracemalloc (acima do que já
+estava alocado) ao montar cada figura sem cache e, à parte, só nos filtros dos dados.
+
+Cada chamada roda uma vez antes da medição (importações tardias, fatias e índices dos cursos) e
+o valor é a mediana das repetições, sem filtro e com dois módulos selecionados.
+
+    python -m benchmarks.bench_alocacao [--escala N] [--repeticoes N]
+"""
+import argparse
+import os
+import tracemalloc
+
+import numpy as np
+
+os.environ.setdefault('PAINEL_CACHE_FIGURAS', 'NullCache')
+os.environ.setdefault('PAINEL_METRICAS', '0')
+os.environ.setdefault('PAINEL_AQUECIMENTO', '0')
+
+
+def pico(funcao, *argumentos, repeticoes=5):
+    funcao(*argumentos)
+    picos = []
+    for _ in range(repeticoes):
+        tracemalloc.start()
+        inicial = tracemalloc.get_traced_memory()[0]
+        funcao(*argumentos)
+        picos.append(tracemalloc.get_traced_memory()[1] - inicial)
+        tracemalloc.stop()
+    return float(np.median(picos))
+
+
+def filtrar(curso, modulos):
+    from pages import pg_cursos
+    from painel.dados import obter_dados
+
+    dados = obter_dados()
+    pg_cursos.filtrar_modulos(dados, curso, modulos)
+    pg_cursos.filtrar_aulas(dados, curso, modulos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--escala', type=int, default=1)
+    parser.add_argument('--repeticoes', type=int, default=5)
+    argumentos = parser.parse_args()
+
+    import painel.dados
+    if argumentos.escala != 1:
+        from benchmarks.sintetico import dados_sinteticos
+        painel.dados._dados = dados_sinteticos(argumentos.escala)
+
+    import app  # noqa: F401  (as páginas só podem ser registradas depois do app)
+    from pages import pg_cursos
+    from painel.cursos import CURSOS
+
+    dados = painel.dados.obter_dados()
+    funcoes = (pg_cursos.figuras_linha_do_tempo, pg_cursos.figuras_indicadores, pg_cursos.figuras_colaboradores)
+    print(f'{argumentos.escala}x: {len(dados.df_cursos)} linhas em df_cursos; pico em kB')
+    print(f'  {"curso":<6} {"filtro":<10} {"filtros":>9}' + ''.join(f' {funcao.__name__:>24}' for funcao in funcoes))
+    totais = np.zeros(1 + len(funcoes))
+    for curso in CURSOS:
+        modulos = tuple(sorted(dados.curso(curso.nome)['Módulo'].unique())[:2])
+        for rotulo, selecao in (('nenhum', None), ('2 módulos', modulos)):
+            # Os filtros uma vez por curso e seleção; as funções de gráfico os incluem
+            picos = [pico(filtrar, curso, selecao, repeticoes=argumentos.repeticoes) / 1e3]
+            picos += [pico(funcao, curso.sigla, selecao, repeticoes=argumentos.repeticoes) / 1e3 for funcao in funcoes]
+            totais += picos
+            print(f'  {curso.sigla:<6} {rotulo:<10} {picos[0]:9.1f}' + ''.join(f' {valor:24.1f}' for valor in picos[1:]))
+    print(f'  {"soma":<17} {totais[0]:9.1f}' + ''.join(f' {valor:24.1f}' for valor in totais[1:]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Tamanho da figura de grafico_geral conforme o histórico cresce: série completa x reduzida (LTTB).
+
+    python -m benchmarks.bench_amostragem [escala]
+"""
+import sys
+import time
+
+import pandas as pd
+import plotly.express as px
+import plotly.io as pio
+
+from benchmarks.sintetico import prog_aulas_curso_sintetico
+from painel.agregacoes import curvas_progressao
+from painel.amostragem import reduzir_series
+
+
+def medir(progressao, reduzir, intervalo=None):
+    inicio = time.perf_counter()
+    if reduzir:
+        progressao = reduzir_series(progressao, 'data final', 'progresso_acumulado', 'curso', intervalo=intervalo)
+    fig = px.line(progressao, x='data final', y='progresso_acumulado', color='curso',
+                  custom_data=['curso', 'Módulo', 'Aula'])
+    corpo = pio.json.to_json_plotly(fig.to_dict())
+    return len(progressao), (time.perf_counter() - inicio) * 1000, len(corpo)
+
+
+def main(escala=100):
+    for fator in sorted({1, 10, escala}):
+        progressao = curvas_progressao(prog_aulas_curso_sintetico(fator))
+        # Zoom de um mês no meio do histórico
+        meio = progressao['data final'].min() + (progressao['data final'].max() - progressao['data final'].min()) / 2
+        janela = (meio.date().isoformat(), (meio + pd.DateOffset(months=1)).date().isoformat())
+
+        print(f'{fator:>4}x ({len(progressao)} pontos)')
+        for rotulo, reduzir, intervalo in [('completa', False, None), ('reduzida', True, None),
+                                           ('reduzida + zoom', True, janela)]:
+            pontos, tempo, tamanho = medir(progressao, reduzir, intervalo)
+            print(f'  {rotulo:<16} {pontos:>8} pontos   {tempo:8.1f} ms   {tamanho / 1e3:9.1f} kB')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
@@ -0,0 +1,65 @@
+"""Compara o boot dos dados lendo os CSVs e lendo o cache binário (pickle/parquet/feather).
+
+Cada cenário roda em um processo novo (como um worker do gunicorn recém-criado),
+medindo o tempo total do processo, o tempo de carga e o pico de RSS. O cache binário fica numa
+pasta temporária (PAINEL_CACHE_DADOS_DIR): o data/.cache do painel não é tocado.
+
+    python -m benchmarks.bench_cache_dados [repeticoes]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+CODIGO_FILHO = """
+import json, resource, time
+inicio = time.perf_counter()
+from painel.dados import carregar_dados
+dados = carregar_dados()
+fim = time.perf_counter()
+print(json.dumps({
+    'boot': fim - inicio,
+    'carga': dados.tempo_carga,
+    'rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'memoria_mb': sum(dados.memoria().values()) / 1e6,
+}))
+"""
+
+
+def executar(usar_cache, formato='pickle', pasta_cache=None):
+    env = dict(os.environ, PAINEL_CACHE_DADOS='1' if usar_cache else '0', PAINEL_FORMATO_CACHE=formato)
+    if pasta_cache is not None:
+        env['PAINEL_CACHE_DADOS_DIR'] = str(pasta_cache)
+    saida = subprocess.run([sys.executable, '-c', CODIGO_FILHO], cwd=RAIZ, env=env,
+                           capture_output=True, text=True, check=True).stdout
+    return json.loads(saida.strip().splitlines()[-1])
+
+
+def resumir(nome, medidas):
+    def mediana(chave):
+        return statistics.median(m[chave] for m in medidas)
+    print(f'{nome:<22} boot {mediana("boot") * 1000:8.1f} ms   carga {mediana("carga") * 1000:8.1f} ms   '
+          f'RSS {mediana("rss_mb"):7.1f} MB   frames {mediana("memoria_mb"):6.2f} MB')
+
+
+def main(repeticoes=5):
+    resumir('CSV', [executar(usar_cache=False) for _ in range(repeticoes)])
+    with tempfile.TemporaryDirectory(prefix='painel-bench-cache-') as temporaria:
+        for formato in ('pickle', 'parquet', 'feather'):
+            pasta_cache = Path(temporaria) / formato
+            try:
+                frio = executar(usar_cache=True, formato=formato, pasta_cache=pasta_cache)
+            except subprocess.CalledProcessError:
+                print(f'Cache {formato:<16} indisponível (pyarrow não instalado?)')
+                continue
+            resumir(f'Cache {formato} (frio)', [frio])
+            resumir(f'Cache {formato}', [executar(usar_cache=True, formato=formato, pasta_cache=pasta_cache)
+                                         for _ in range(repeticoes)])
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,56 @@
+"""Cor das linhas de 'Progresso das aulas': varredura por trace x consulta vetorizada por ID.
+
+    python -m benchmarks.bench_cores_linhas [quantidade de IDs]
+"""
+import sys
+import timeit
+
+import numpy as np
+import plotly.express as px
+
+from benchmarks.sintetico import curso_com_ids
+from painel.agregacoes import progresso_final_por_id
+
+COR, PENDENTE = '#FF0023', '#ffd700'
+
+
+def cores_por_trace(fig, df):
+    # Implementação anterior: um filtro no DataFrame inteiro para cada trace
+    for i, id in enumerate(fig.data):
+        progresso = df[df['ID'] == id.name]['progresso'].iloc[-1]
+        cor = COR if progresso == 100 else PENDENTE
+        fig.data[i].line.color = cor
+        fig.data[i].marker.color = cor
+    return fig
+
+
+def cores_vetorizado(progresso_final, ids):
+    # Mapa ID -> cor passado ao px.line (color_discrete_map): nenhuma passada extra pelos traces
+    progresso = progresso_final.reindex(ids)
+    return dict(zip(progresso.index, np.where(progresso.to_numpy() == 100, COR, PENDENTE).tolist()))
+
+
+def medir(funcao, repeticoes):
+    return min(timeit.repeat(funcao, number=1, repeat=repeticoes)) * 1000
+
+
+def main(quantidade=10_000):
+    for n in sorted({275, quantidade}):
+        df = curso_com_ids(n)
+        fig = px.line(df, x='data final', y='progresso', color='ID', markers=True)
+        repeticoes = 3 if n <= 1000 else 1
+
+        ids = df['ID'].unique().astype(str)
+        carga = medir(lambda: progresso_final_por_id(df), 3)
+        progresso_final = progresso_final_por_id(df)
+        antes = medir(lambda: cores_por_trace(fig, df), repeticoes)
+        depois = medir(lambda: cores_vetorizado(progresso_final, ids), repeticoes)
+
+        mapa = cores_vetorizado(progresso_final, ids)
+        assert all(trace.line.color == mapa[trace.name] for trace in fig.data)
+        print(f'{n:>6} IDs ({len(df):>7} linhas)  por trace {antes:9.1f} ms   vetorizado {depois:7.2f} ms '
+              f'(+{carga:.1f} ms na carga)   {antes / depois:8.0f}x')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,183 @@
+"""Latência (fria e quente), pico de memória e tamanho serializado de cada função de figura,
+com datasets sintéticos 1x, 10x e 100x maiores que os CSVs (benchmarks/sintetico.py: mais cursos,
+módulos, aulas, subtarefas por aula e um histórico mais longo).
+
+Fria: cache da função invalidado antes de cada execução (monta e grava a figura).
+Quente: a mesma chamada servida pelo cache (SimpleCache, com a desserialização).
+Cada escala roda num processo próprio: as páginas leem os dados na importação e o pico de
+memória de uma escala não contamina a seguinte.
+
+    python -m benchmarks.bench_figuras [escalas...] [--repeticoes N]
+    python -m benchmarks.bench_figuras --salvar base.json          # guarda os resultados
+    python -m benchmarks.bench_figuras --comparar base.json        # falha (código 1) se piorou
+"""
+import argparse
+import gzip
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+ESCALAS = [1, 10, 100]
+TOLERANCIA = 0.25  # piora aceita no --comparar (p50 frio e tamanho)
+
+
+def funcoes_de_figura():
+    # (página, nome, função com cache, argumentos) de cada figura do painel. A Visão Geral roda sem
+    # filtro (todos os cursos, inclusive os sintéticos) e com todos menos um selecionados, como o
+    # callback normaliza o filtro; as abas por curso, nos três cursos reais (os que têm página)
+    from pages import pg_cursos, pg_geral
+    from painel.agregacoes import PERIODOS
+    from painel.cache import normalizar_selecao
+    from painel.cursos import CURSOS
+
+    cursos = sorted(pg_geral.cursos_disponiveis())
+    funcoes = []
+    for rotulo, selecao in (('', None), ('[seleção]', normalizar_selecao(cursos[1:], cursos))):
+        funcoes.append(('visaogeral', f'grafico_geral{rotulo}', pg_geral.grafico_geral, (selecao,)))
+        funcoes += [('visaogeral', f'aulas_concluidas_periodo[{periodo}]{rotulo}', pg_geral.aulas_concluidas_periodo,
+                     (selecao, periodo)) for periodo in PERIODOS]
+    for curso in CURSOS:
+        for funcao in (pg_cursos.figuras_linha_do_tempo, pg_cursos.figuras_indicadores, pg_cursos.figuras_colaboradores):
+            funcoes.append((curso.sigla, funcao.__name__, funcao, (curso.sigla, None)))
+    return funcoes
+
+
+def _tamanhos(resultado):
+    import plotly.io as pio
+
+    figuras = resultado if isinstance(resultado, tuple) else (resultado,)
+    corpos = [pio.json.to_json_plotly(figura).encode() for figura in figuras if isinstance(figura, dict)]
+    return sum(map(len, corpos)), sum(len(gzip.compress(corpo)) for corpo in corpos)
+
+
+def _percentis(tempos):
+    tempos = np.array(tempos) * 1000
+    return {'p50': float(np.percentile(tempos, 50)), 'p95': float(np.percentile(tempos, 95)),
+            'max': float(tempos.max())}
+
+
+def medir_escala(escala, repeticoes):
+    # Executado no processo filho: troca os dados antes de importar o app e as páginas
+    os.environ['PAINEL_CACHE_FIGURAS'] = 'SimpleCache'
+    os.environ['PAINEL_METRICAS'] = '0'
+    os.environ['PAINEL_AQUECIMENTO'] = '0'
+    import painel.dados
+    from benchmarks.sintetico import dados_sinteticos
+
+    inicio = time.perf_counter()
+    painel.dados._dados = dados_sinteticos(escala)
+    montagem = time.perf_counter() - inicio
+
+    import app  # noqa: F401  (as páginas só podem ser registradas depois do app)
+
+    funcoes = funcoes_de_figura()
+    # Uma passada antes das medições: importações tardias do plotly (validadores, template)
+    # não entram no pico nem nos tempos da primeira função
+    for _, _, funcao, argumentos in funcoes:
+        funcao(*argumentos)
+
+    resultados = []
+    for pagina, nome, funcao, argumentos in funcoes:
+        # Pico de memória numa execução à parte: o tracemalloc deixa as alocações mais lentas
+        funcao.cache_clear()
+        tracemalloc.start()
+        resultado = funcao(*argumentos)
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        frias, quentes = [], []
+        for _ in range(repeticoes):
+            funcao.cache_clear()
+            inicio = time.perf_counter()
+            funcao(*argumentos)
+            frias.append(time.perf_counter() - inicio)
+            inicio = time.perf_counter()
+            funcao(*argumentos)
+            quentes.append(time.perf_counter() - inicio)
+
+        json_bytes, gzip_bytes = _tamanhos(resultado)
+        resultados.append({'pagina': pagina, 'funcao': nome, 'fria': _percentis(frias), 'quente': _percentis(quentes),
+                           'pico_bytes': pico, 'json_bytes': json_bytes, 'gzip_bytes': gzip_bytes})
+
+    dados = painel.dados._dados
+    return {'escala': escala, 'linhas_df_cursos': len(dados.df_cursos),
+            'linhas_prog_aulas_curso': len(dados.prog_aulas_curso), 'ids': int(dados.df_cursos['ID'].nunique()),
+            'cursos': int(dados.prog_aulas_curso['curso'].nunique()),
+            'montagem_s': montagem, 'figuras': resultados}
+
+
+def rodar_escala(escala, repeticoes):
+    processo = subprocess.run([sys.executable, '-m', 'benchmarks.bench_figuras', '--filho', str(escala),
+                               '--repeticoes', str(repeticoes)],
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
+    return json.loads(processo.stdout)
+
+
+def imprimir(escala):
+    print(f"\n{escala['escala']}x: {escala['cursos']} cursos, {escala['linhas_df_cursos']} linhas em df_cursos "
+          f"({escala['ids']} IDs), {escala['linhas_prog_aulas_curso']} em prog_aulas_curso; dados montados em {escala['montagem_s']:.2f} s")
+    print(f'  {"página":<10} {"função":<40} {"fria p50/p95/máx (ms)":>24} {"quente p50/p95 (ms)":>20} '
+          f'{"pico":>10} {"JSON":>10} {"gzip":>9}')
+    for figura in escala['figuras']:
+        fria, quente = figura['fria'], figura['quente']
+        print(f"  {figura['pagina']:<10} {figura['funcao']:<40} "
+              f"{fria['p50']:7.1f} {fria['p95']:7.1f} {fria['max']:8.1f} "
+              f"{quente['p50']:9.2f} {quente['p95']:9.2f} "
+              f"{figura['pico_bytes'] / 1e6:7.1f} MB {figura['json_bytes'] / 1e3:7.1f} kB {figura['gzip_bytes'] / 1e3:6.1f} kB")
+
+
+def comparar(atuais, base, tolerancia=TOLERANCIA):
+    # Piora de p50 frio ou tamanho acima da tolerância, por escala e função
+    anteriores = {(escala['escala'], figura['pagina'], figura['funcao']): figura
+                  for escala in base for figura in escala['figuras']}
+    pioras = []
+    for escala in atuais:
+        for figura in escala['figuras']:
+            anterior = anteriores.get((escala['escala'], figura['pagina'], figura['funcao']))
+            if anterior is None:
+                continue
+            for rotulo, atual, antes in [('fria p50', figura['fria']['p50'], anterior['fria']['p50']),
+                                         ('JSON', figura['json_bytes'], anterior['json_bytes'])]:
+                if atual > antes * (1 + tolerancia):
+                    pioras.append(f"{escala['escala']}x {figura['pagina']} {figura['funcao']}: "
+                                  f"{rotulo} {antes:.1f} -> {atual:.1f} (+{atual / antes - 1:.0%})")
+    return pioras
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('escalas', nargs='*', type=int, default=ESCALAS)
+    parser.add_argument('--repeticoes', type=int, default=10)
+    parser.add_argument('--salvar')
+    parser.add_argument('--comparar')
+    parser.add_argument('--tolerancia', type=float, default=TOLERANCIA)
+    parser.add_argument('--filho', type=int, help=argparse.SUPPRESS)
+    argumentos = parser.parse_args()
+
+    if argumentos.filho is not None:
+        json.dump(medir_escala(argumentos.filho, argumentos.repeticoes), sys.stdout)
+        return
+
+    resultados = []
+    for escala in argumentos.escalas:
+        resultados.append(rodar_escala(escala, argumentos.repeticoes))
+        imprimir(resultados[-1])
+
+    if argumentos.salvar:
+        with open(argumentos.salvar, 'w') as arquivo:
+            json.dump(resultados, arquivo, indent=1)
+    if argumentos.comparar:
+        with open(argumentos.comparar) as arquivo:
+            pioras = comparar(resultados, json.load(arquivo), argumentos.tolerancia)
+        print('\nSem regressões.' if not pioras else '\nRegressões:\n  ' + '\n  '.join(pioras))
+        if pioras:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""'Progresso das aulas': um trace por ID (px.line) x um trace WebGL por situação com lacunas.
+
+    python -m benchmarks.bench_linhas_aulas [quantidade de IDs]
+"""
+import sys
+import time
+
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from benchmarks.sintetico import curso_com_ids
+from painel.agregacoes import progresso_final_por_id, segmentos_separados
+
+COR, PENDENTE = '#FF0023', '#ffd700'
+
+
+def linhas_por_id(df, progresso_final):
+    # Implementação anterior: px.line com color='ID'
+    cores = {id: COR if progresso == 100 else PENDENTE for id, progresso in progresso_final.items()}
+    return px.line(df, x='data final', y='progresso', color='ID', color_discrete_map=cores, markers=True,
+                   hover_data={'ID': False, 'Aula': True, 'Módulo': True})
+
+
+def linhas_por_situacao(df, progresso_final):
+    concluida = progresso_final.reindex(df['ID'].astype(str)).to_numpy() == 100
+    fig = go.Figure()
+    for nome, mascara, cor in [('Concluída', concluida, COR), ('Em andamento', ~concluida, PENDENTE)]:
+        segmentos = segmentos_separados(df[mascara], 'ID')
+        fig.add_trace(go.Scattergl(x=segmentos['data final'], y=segmentos['progresso'],
+                                   customdata=segmentos[['ID', 'Aula', 'Módulo']].astype(object),
+                                   name=nome, mode='lines+markers', line_color=cor))
+    return fig
+
+
+def medir(funcao, df, progresso_final):
+    inicio = time.perf_counter()
+    fig = funcao(df, progresso_final)
+    montagem = time.perf_counter() - inicio
+    # Mesmo caminho do callback: to_dict no cache, JSON na resposta do Dash
+    inicio = time.perf_counter()
+    corpo = pio.json.to_json_plotly(fig.to_dict())
+    serializacao = time.perf_counter() - inicio
+    return len(fig.data), montagem * 1000, serializacao * 1000, len(corpo)
+
+
+def main(quantidade=2000):
+    for n in sorted({275, quantidade}):
+        df = curso_com_ids(n)
+        progresso_final = progresso_final_por_id(df)
+        print(f'{n} IDs ({len(df)} linhas)')
+        for rotulo, funcao in [('por ID', linhas_por_id), ('por situação', linhas_por_situacao)]:
+            traces, montagem, serializacao, tamanho = medir(funcao, df, progresso_final)
+            print(f'  {rotulo:<13} {traces:>6} traces   montagem {montagem:9.1f} ms   '
+                  f'JSON {serializacao:7.1f} ms   {tamanho / 1e3:9.1f} kB')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,79 @@
+"""Agrupamento semanal de aulas_concluidas_periodo: apply por linha x versão vetorizada.
+
+    python -m benchmarks.bench_semanas [escala]
+"""
+import sys
+import timeit
+from datetime import date, timedelta
+
+import pandas as pd
+
+from benchmarks.sintetico import prog_aulas_curso_sintetico
+from painel.agregacoes import quinta_feira_da_semana
+
+
+def quintas_por_linha(prog_aulas_curso):
+    # Implementação anterior (apply linha a linha com objetos date)
+    prog_aulas_semana = prog_aulas_curso.copy()
+    prog_aulas_semana['Ano'] = prog_aulas_semana['data final'].dt.year
+    prog_aulas_semana['Semana'] = prog_aulas_semana['data final'].dt.isocalendar().week
+
+    def encontrar_primeira_quinta(row):
+        data_referencia = date(row['Ano'], 1, 1)
+        delta_dias = (7 - data_referencia.weekday()) % 7 + (row['Semana'] - 1) * 7 + 3
+        return data_referencia + timedelta(days=delta_dias)
+
+    prog_aulas_semana['Semana'] = prog_aulas_semana.apply(encontrar_primeira_quinta, axis=1)
+    return prog_aulas_semana
+
+
+def semanas_por_linha(prog_aulas_curso):
+    prog_aulas_semana = quintas_por_linha(prog_aulas_curso)
+    return prog_aulas_semana.groupby(['Semana', 'curso'], observed=True)['progresso_100'].sum()
+
+
+def semanas_vetorizado(prog_aulas_curso):
+    semanal = prog_aulas_curso.assign(Semana=quinta_feira_da_semana(prog_aulas_curso['data final']))
+    return semanal.groupby(['Semana', 'curso'], observed=True)['progresso_100'].sum()
+
+
+def conferir(df):
+    # Linha a linha: a versão vetorizada dá a quinta-feira da semana ISO de cada data e coincide com o
+    # apply anterior onde a fórmula dele vale (fora dos anos que começam de terça a quinta e das semanas
+    # ISO que atravessam 1º de janeiro, onde a âncora anterior saía deslocada).
+    # Sem nenhuma linha nesses casos, as somas por semana também são iguais. Devolve quantas linhas caem neles.
+    datas = df['data final']
+    novo = quinta_feira_da_semana(datas)
+    referencia = pd.to_datetime([date.fromisocalendar(*data.isocalendar()[:2], 4) for data in datas])
+    assert (novo.to_numpy() == referencia.to_numpy()).all()
+
+    antigo = pd.to_datetime(quintas_por_linha(df)['Semana'])
+    ano = datas.dt.year
+    primeiro_dia = pd.to_datetime(pd.DataFrame({'year': ano, 'month': 1, 'day': 1}))
+    vale = (datas.dt.isocalendar().year == ano) & ~primeiro_dia.dt.weekday.isin([1, 2, 3])
+    assert (antigo[vale] == novo[vale]).all()
+    divergentes = int((~vale).sum())
+    if not divergentes:
+        somas = semanas_por_linha(df)
+        somas.index = somas.index.set_levels(pd.to_datetime(somas.index.levels[0]), level='Semana')
+        pd.testing.assert_series_equal(semanas_vetorizado(df), somas)
+    return divergentes
+
+
+def medir(funcao, df, repeticoes):
+    return min(timeit.repeat(lambda: funcao(df), number=1, repeat=repeticoes)) * 1000
+
+
+def main(escala=100):
+    for fator in sorted({1, escala}):
+        df = prog_aulas_curso_sintetico(fator)
+        repeticoes = 5 if fator <= 10 else 2
+        divergentes = conferir(df)
+        antes = medir(semanas_por_linha, df, repeticoes)
+        depois = medir(semanas_vetorizado, df, repeticoes)
+        print(f'{fator:>4}x ({len(df):>7} linhas)  apply {antes:9.1f} ms   vetorizado {depois:7.1f} ms   '
+              f'{antes / depois:6.1f}x   ({divergentes} linhas com a âncora anterior errada)')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
@@ -0,0 +1,64 @@
+"""Bytes e tempo de codificação de cada figura: fig.to_dict() + JSON x figura compacta (typed arrays).
+
+    python -m benchmarks.bench_serializacao
+"""
+import gzip
+import os
+import time
+
+os.environ.setdefault('PAINEL_CACHE_FIGURAS', 'NullCache')
+os.environ.setdefault('PAINEL_AQUECIMENTO', '0')
+
+import plotly.io as pio
+
+import app  # noqa: F401  (as páginas só podem ser registradas depois do app)
+from pages import pg_cursos, pg_geral
+from painel.cursos import CURSOS
+from painel.serializacao import compactar_figura
+
+
+def capturar_figuras(construir):
+    # Executa o builder sem cache, guardando as go.Figure antes da serialização
+    figuras = []
+    for pagina in (pg_cursos, pg_geral):
+        pagina.compactar_figura = lambda fig: figuras.append(fig) or fig
+    try:
+        construir()
+    finally:
+        for pagina in (pg_cursos, pg_geral):
+            pagina.compactar_figura = compactar_figura
+    return figuras
+
+
+def medir(serializar, fig, repeticoes=5):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        corpo = pio.json.to_json_plotly(serializar(fig))
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos) * 1000, len(corpo), len(gzip.compress(corpo.encode()))
+
+
+def main():
+    paginas = {'visaogeral': lambda: (pg_geral.grafico_geral.__wrapped__(None),
+                                      pg_geral.aulas_concluidas_periodo.__wrapped__(None, 'dia'))}
+    for curso in CURSOS:
+        paginas[curso.sigla] = lambda sigla=curso.sigla: (
+            pg_cursos.figuras_linha_do_tempo.__wrapped__(sigla, None),
+            pg_cursos.figuras_indicadores.__wrapped__(sigla, None),
+            pg_cursos.figuras_colaboradores.__wrapped__(sigla, None),
+        )
+
+    print(f'{"página":<11} {"figura":<22} {"to_dict":>20} {"compacta":>20} {"gzip":>17}')
+    for pagina, construir in paginas.items():
+        for fig in capturar_figuras(construir):
+            nome = (fig.layout.title.text or fig.data[0].type)[:22]
+            tempo_antes, bytes_antes, gzip_antes = medir(lambda f: f.to_dict(), fig)
+            tempo_depois, bytes_depois, gzip_depois = medir(compactar_figura, fig)
+            print(f'{pagina:<11} {nome:<22} {bytes_antes / 1e3:8.1f} kB {tempo_antes:6.1f} ms '
+                  f'{bytes_depois / 1e3:8.1f} kB {tempo_depois:6.1f} ms '
+                  f'{gzip_antes / 1e3:6.1f} -> {gzip_depois / 1e3:5.1f} kB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""Bytes transferidos por carregamento de página, sem e com compressão, na primeira e na segunda visita.
+
+Simula o navegador com o cliente de teste do Flask: HTML, JS/CSS locais (inclusive os chunks
+carregados sob demanda pelo dcc.Graph), layout, dependências e os callbacks disparados na abertura.
+
+    python -m benchmarks.bench_transferencia
+"""
+import gzip
+import json
+import os
+import re
+
+os.environ.setdefault('PAINEL_CACHE_FIGURAS', 'NullCache')
+os.environ.setdefault('PAINEL_AQUECIMENTO', '0')
+
+import app  # noqa: E402
+from painel.cursos import CURSOS  # noqa: E402
+from painel.respostas import brotli  # noqa: E402
+
+CHUNKS = ['/_dash-component-suites/dash/dcc/async-graph.js',
+          '/_dash-component-suites/plotly/package_data/plotly.min.js']
+
+
+def _id(componente):
+    return json.dumps(componente, sort_keys=True, separators=(',', ':'))
+
+
+def callbacks_da_pagina(caminho):
+    # Corpos de POST para /_dash-update-component disparados ao abrir a página
+    conteudo = {'output': '.._pages_content.children..._pages_store.data..',
+                'outputs': [{'id': '_pages_content', 'property': 'children'},
+                            {'id': '_pages_store', 'property': 'data'}],
+                'inputs': [{'id': '_pages_location', 'property': 'pathname', 'value': caminho},
+                           {'id': '_pages_location', 'property': 'search', 'value': ''}],
+                'changedPropIds': ['_pages_location.pathname']}
+    if caminho == '/visaogeral':
+        return [conteudo] + [{'output': f'{store}.data',
+                              'outputs': {'id': store, 'property': 'data'},
+                              'inputs': [{'id': 'filtro-cursos', 'property': 'value', 'value': None},
+                                         {'id': grafico, 'property': 'relayoutData', 'value': None}],
+                              'changedPropIds': []}
+                             for store, grafico in [('figura-geral', 'g-geral'), ('figuras-concluidas', 'g-concluidas')]]
+
+    sigla = caminho.strip('/')
+    figura = {'tipo': 'figura', 'grafico': 'gantt', 'curso': sigla}
+    desenhado = {'tipo': 'desenhado', 'aba': 'tabgan', 'curso': sigla}
+    voltar = {'tipo': 'voltar-aulas', 'curso': sigla}
+    paginas = {'tipo': 'paginas-gantt', 'curso': sigla}
+    saidas = [(figura, 'data'), (desenhado, 'data'), (voltar, 'style'),
+              (paginas, 'max_value'), (paginas, 'active_page'), (paginas, 'style')]
+    padrao = '..' + '...'.join(_id({**id_, 'curso': ['MATCH']}) + '.' + prop for id_, prop in saidas) + '..'
+    pagina = {'output': padrao,
+              'outputs': [{'id': id_, 'property': prop} for id_, prop in saidas],
+              'inputs': [{'id': {'tipo': 'filtro-modulo', 'curso': sigla}, 'property': 'value', 'value': None},
+                         {'id': {'tipo': 'abas', 'curso': sigla}, 'property': 'active_tab', 'value': 'tabgan'},
+                         {'id': {'tipo': 'grafico', 'grafico': 'gantt', 'curso': sigla}, 'property': 'clickData',
+                          'value': None},
+                         {'id': voltar, 'property': 'n_clicks', 'value': None},
+                         {'id': paginas, 'property': 'active_page', 'value': 1}],
+              'state': [{'id': desenhado, 'property': 'data', 'value': None}],
+              'changedPropIds': []}
+    return [conteudo, pagina]
+
+
+def carregar_pagina(cliente, caminho, codificacao, cache_navegador):
+    # Retorna os bytes recebidos; cache_navegador guarda URL -> ETag/imutável entre visitas
+    cabecalhos = {'Accept-Encoding': codificacao}
+    total = 0
+
+    def obter(url):
+        nonlocal total
+        guardado = cache_navegador.get(url)
+        if guardado == 'imutavel':
+            return None
+        extra = {'If-None-Match': guardado} if guardado else {}
+        resposta = cliente.get(url, headers={**cabecalhos, **extra})
+        total += len(resposta.data)
+        if 'immutable' in (resposta.headers.get('Cache-Control') or '') or \
+                'max-age=31536000' in (resposta.headers.get('Cache-Control') or ''):
+            cache_navegador[url] = 'imutavel'
+        elif resposta.headers.get('ETag'):
+            cache_navegador[url] = resposta.headers['ETag']
+        return resposta
+
+    html = _descomprimir(obter(caminho))
+    locais = [url for url in re.findall(r'(?:src|href)="(/[^"]+)"', html.decode())]
+    for url in locais + CHUNKS + ['/_dash-layout', '/_dash-dependencies']:
+        obter(url)
+    layout = cliente.get('/_dash-layout').get_data(as_text=True)
+    for url in re.findall(r'"(\\u002fassets[^"]+)"', layout):
+        obter(url.replace('\\u002f', '/'))
+    for corpo in callbacks_da_pagina(caminho):
+        total += len(cliente.post('/_dash-update-component', json=corpo, headers=cabecalhos).data)
+    return total
+
+
+def _descomprimir(resposta):
+    codificacao = resposta.headers.get('Content-Encoding')
+    if codificacao == 'gzip':
+        return gzip.decompress(resposta.data)
+    if codificacao == 'br':
+        return brotli.decompress(resposta.data)
+    return resposta.data
+
+
+def main():
+    cliente = app.server.test_client()
+    codificacoes = ['identity', 'gzip'] + (['br'] if brotli is not None else [])
+    paginas = ['/visaogeral'] + [curso.caminho for curso in CURSOS]
+    print(f'{"página":<12}' + ''.join(f'{c + " (1ª / 2ª visita)":>32}' for c in codificacoes))
+    for caminho in paginas:
+        linha = f'{caminho:<12}'
+        for codificacao in codificacoes:
+            cache_navegador = {}
+            primeira = carregar_pagina(cliente, caminho, codificacao, cache_navegador)
+            segunda = carregar_pagina(cliente, caminho, codificacao, cache_navegador)
+            linha += f'{primeira / 1e3:17.1f} / {segunda / 1e3:7.1f} kB'
+        print(linha)
+
+
+if __name__ == '__main__':
+    main()
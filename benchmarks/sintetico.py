@@ -0,0 +1,115 @@
+"""Datasets sintéticos derivados dos CSVs reais, para medir o painel em escalas maiores."""
+import math
+
+import numpy as np
+import pandas as pd
+
+from painel.dados import ler_df_cursos, ler_prog_aulas_curso, montar_dados
+from painel.esquema import CURSOS, ESQUEMA_CURSOS, ESQUEMA_PROGRESSO, aplicar_esquema
+
+
+def estender_historico(df, escala, colunas_data=('data final',)):
+    # Repete o dataset `escala` vezes, deslocando cada cópia para depois da anterior:
+    # mesmo perfil de dados, com um histórico `escala` vezes mais longo
+    inicio = min(df[coluna].min() for coluna in colunas_data)
+    fim = max(df[coluna].max() for coluna in colunas_data)
+    # Deslocamento em semanas inteiras preserva o dia da semana de cada data
+    passo = pd.Timedelta(weeks=(fim - inicio).days // 7 + 1)
+
+    copias = []
+    for i in range(escala):
+        copia = df.copy()
+        for coluna in colunas_data:
+            copia[coluna] = copia[coluna] + passo * i
+        copias.append(copia)
+    return pd.concat(copias, ignore_index=True)
+
+
+def prog_aulas_curso_sintetico(escala):
+    return estender_historico(ler_prog_aulas_curso(), escala)
+
+
+def curso_com_ids(quantidade, nome='Gestão e Controle de Negócios'):
+    # Um curso com `quantidade` IDs: as aulas reais do curso repetidas com IDs novos
+    # (sufixo -N), mantendo as linhas de cada ID contíguas como no CSV
+    curso = ler_df_cursos()
+    curso = curso[curso['curso'] == nome]
+    ids = curso['ID'].astype(str)
+    copias = []
+    for i in range(-(-quantidade // ids.nunique())):
+        copias.append(curso.assign(ID=ids + f'-{i}'))
+    df = pd.concat(copias, ignore_index=True)
+    mantidos = df['ID'].unique()[:quantidade]
+    df = df[df['ID'].isin(mantidos)].reset_index(drop=True)
+    df['ID'] = df['ID'].astype('category')
+    return df
+
+
+def _copias_numeradas(df, escala, passo, colunas_data, colunas_sufixo):
+    # Como estender_historico, mas cada cópia também ganha IDs/módulos próprios (sufixo [i]):
+    # mais módulos, aulas e subtarefas, não só o mesmo curso repetido no tempo
+    copias = []
+    for i in range(escala):
+        copia = df.copy()
+        for coluna in colunas_data:
+            copia[coluna] = copia[coluna] + passo * i
+        if i:
+            for coluna in colunas_sufixo:
+                copia[coluna] = copia[coluna].astype(str) + f' [{i}]'
+        copias.append(copia)
+    return pd.concat(copias, ignore_index=True)
+
+
+def _mais_subtarefas(df, vezes):
+    # Cada subtarefa repetida `vezes` vezes na sua aula (sufixo (j)), logo após a original:
+    # as linhas de cada ID continuam contíguas e a última linha do ID continua a mesma
+    if vezes == 1:
+        return df
+    repeticoes = np.where(df['Subtarefa'].notna(), vezes, 1)
+    df = df.loc[df.index.repeat(repeticoes)]
+    numero = df.groupby(level=0).cumcount()
+    subtarefa = df['Subtarefa'].astype(object)
+    df = df.assign(Subtarefa=subtarefa.where(numero == 0, subtarefa.astype(str) + ' (' + numero.astype(str) + ')'))
+    return df.reset_index(drop=True)
+
+
+def _cursos_sinteticos(df_cursos, prog_aulas_curso, quantidade):
+    # Cursos novos para a Visão Geral: cada um é o histórico original de um dos cursos reais
+    # (em rodízio) com outro nome e IDs/módulos próprios. Não têm página: só entram nos gráficos
+    # e agregações que percorrem todos os cursos.
+    nomes = [f'Curso sintético {i:03d}' for i in range(1, quantidade + 1)]
+    cursos, progressos = [], []
+    for i, nome in enumerate(nomes):
+        original = CURSOS[i % len(CURSOS)]
+        curso = df_cursos[df_cursos['curso'] == original]
+        progresso = prog_aulas_curso[prog_aulas_curso['curso'] == original]
+        cursos.append(curso.assign(curso=nome, ID=curso['ID'].astype(str) + f' <{i + 1}>',
+                                   Módulo=curso['Módulo'].astype(str) + f' <{i + 1}>'))
+        progressos.append(progresso.assign(curso=nome, Módulo=progresso['Módulo'].astype(str) + f' <{i + 1}>'))
+    return nomes, cursos, progressos
+
+
+def dados_sinteticos(escala):
+    # df_cursos e prog_aulas_curso com o histórico, os IDs e os módulos `escala` vezes maiores, as tabelas
+    # derivadas montadas como na carga real (montar_dados); a mesma escala estende os dois datasets em
+    # sincronia. Também crescem as subtarefas por aula (1, 2 e 3 vezes em 1x, 10x e 100x) e o número
+    # de cursos: escala - 1 cursos sintéticos além dos três reais (3, 12 e 102 cursos)
+    df_cursos, prog_aulas_curso = ler_df_cursos(), ler_prog_aulas_curso()
+    datas = pd.concat([df_cursos['data inicial'], df_cursos['data final'], prog_aulas_curso['data final']])
+    passo = pd.Timedelta(weeks=(datas.max() - datas.min()).days // 7 + 1)
+    nomes, cursos_extras, progressos_extras = _cursos_sinteticos(df_cursos, prog_aulas_curso, escala - 1)
+
+    df_cursos = _copias_numeradas(df_cursos, escala, passo, ('data inicial', 'data final'), ('ID', 'Módulo'))
+    df_cursos = _mais_subtarefas(pd.concat([df_cursos, *cursos_extras], ignore_index=True),
+                                 1 + int(math.log10(escala)))
+    prog_aulas_curso = _copias_numeradas(prog_aulas_curso, escala, passo, ('data final',), ('Módulo',))
+    prog_aulas_curso = pd.concat([prog_aulas_curso, *progressos_extras], ignore_index=True)
+    # Progresso acumulado contínuo entre as cópias, como num histórico único
+    prog_aulas_curso['progresso_acumulado'] = prog_aulas_curso.groupby('curso', observed=True)['progresso_100'].cumsum()
+
+    # O esquema só aceita os cursos da tabela; os sintéticos entram nas categorias de 'curso'
+    categorias = pd.CategoricalDtype(sorted(CURSOS + nomes))
+    return montar_dados(aplicar_esquema(df_cursos, {**ESQUEMA_CURSOS, 'curso': categorias}, 'df_cursos'),
+                        aplicar_esquema(prog_aulas_curso, {**ESQUEMA_PROGRESSO, 'curso': categorias},
+                                        'prog_aulas_curso'),
+                        versao=f'sintetico-{escala}x')
@@ -0,0 +1,597 @@
+import dash
+from dash import callback, ctx, dcc, html, no_update, Input, Output, State, MATCH
+from dash.exceptions import PreventUpdate
+import dash_bootstrap_components as dbc
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+from datetime import date
+from functools import partial
+
+from painel.cache import cache_figuras, normalizar_selecao
+from painel.cursos import CURSOS, CURSOS_POR_SIGLA
+from painel.agregacoes import segmentos_separados
+from painel.amostragem import paginar
+from painel.aquecimento import registrar_aquecimento
+from painel.dados import fixar_dados, obter_dados
+from painel.metricas import cronometrar, etapa
+from painel.serializacao import compactar_figura, expandir_no_navegador
+
+# Página de curso parametrizada: uma página registrada por linha de painel/cursos.py,
+# todas servidas pelas mesmas funções de gráficos, cache e callbacks (pattern-matching por curso)
+
+# Estilo
+
+# Para os Gráficos
+grafico_config = {
+    "showlegend": False,
+    "plot_bgcolor": "rgba(0, 0, 0, 0)",
+    "paper_bgcolor": "rgba(0, 0, 0, 0)",
+    "margin": {"pad": 0},
+    "margin_b": 60,
+    "font_color": "#D3D3D3",
+}
+
+# Botão 'Voltar às aulas', por aula detalhada ou não
+ESTILO_VOLTAR = {False: {'display': 'none'}, True: {'marginBottom': '0.5rem'}}
+# Paginação da linha do tempo, com mais de uma página de aulas
+ESTILO_PAGINAS = {False: {'display': 'none'}, True: {}}
+
+
+def cores_status(curso):
+    return {'CONCLUÍDA': curso.cor,
+            'EM ANDAMENTO': '#ffd700',
+            'PENDENTE': 'gray'}
+
+
+def seletor_intervalo(curso):
+    return dict(buttons=list([
+        dict(count=1, label='mês', step='month', stepmode='todate', ),
+        dict(count=6, label='semestre', step='month', stepmode='todate'),
+        dict(count=1, label='ano', step='year', stepmode='todate'),
+        dict(count=1, label='todo', step='all')]),
+        bgcolor='rgba(0, 0, 0, 0)', activecolor=curso.cor_seletor)
+
+
+# dataset (compartilhado entre as páginas); `dados` é a versão lida uma vez por função de gráfico
+def df_curso(dados, curso):
+    return dados.curso(curso.nome)
+
+
+# Cache e funções de gráficos: uma função por aba, para calcular só a aba visível
+def filtrar_modulos(dados, curso, modulo_selecionado):
+    with etapa('dados'):
+        return dados.filtrar(curso.nome, {'Módulo': modulo_selecionado})
+
+
+def filtrar_aulas(dados, curso, modulo_selecionado):
+    # O mesmo filtro sobre o resumo por aula (uma linha por ID, montado na carga dos dados)
+    with etapa('dados'):
+        return dados.filtrar(curso.nome, {'Módulo': modulo_selecionado}, aulas=True)
+
+
+@cache_figuras(maxsize=32)
+def figuras_linha_do_tempo(sigla, modulo_selecionado, hoje=None, aula=None, pagina=1):
+    curso = CURSOS_POR_SIGLA[sigla]
+    dados = obter_dados()
+    aulas = filtrar_aulas(dados, curso, modulo_selecionado)
+
+# Operação com o df para gerar o gráfico
+    data_minima = aulas['data inicial'].min()
+    data_maxima = hoje or date.today()
+
+    if aula is None:
+        # Uma barra por aula (da primeira à última subtarefa), uma página de aulas por vez;
+        # o clique numa barra detalha a aula
+        barras, paginas = paginar(aulas, pagina)
+        eixo_y, titulo, titulo_y = 'ID', 'Linha do tempo — Produção das Aulas', 'Aulas'
+        customdata = np.stack((barras['Módulo'], barras['Aula'], barras['subtarefas']), axis=-1)
+        detalhe = 'Subtarefas: %{customdata[2]}<br>'
+    else:
+        # Subtarefas de uma aula, cada uma com o seu responsável
+        with etapa('dados'):
+            linhas = df_curso(dados, curso)
+            barras = linhas[linhas['ID'] == aula]
+            barras = barras.assign(Subtarefa=barras['Subtarefa'].astype(object).fillna('Aula completa'))
+            paginas = 1
+        eixo_y, titulo, titulo_y = 'Subtarefa', f'Linha do tempo — {aula}: Subtarefas', 'Subtarefas'
+        customdata = np.stack((barras['Módulo'], barras['Aula'], barras['Responsável']), axis=-1)
+        detalhe = 'Responsável: %{customdata[2]}<br>'
+
+# Plotagem do gráfico
+    gantt = px.timeline(barras,
+                        x_start='data inicial',
+                        x_end='data final',
+                        y=eixo_y,
+                        color='progresso_final' if aula is None else 'progresso',
+                        labels={'progresso_final': 'progresso'},
+                        color_continuous_scale=['#ffd700', curso.cor],)
+    gantt.update_layout(grafico_config, title={'text': titulo, 'x': 0.5})
+    gantt.update_yaxes(autorange='reversed', title=titulo_y,)
+    gantt.update_xaxes(title='Seletor de intervalo', gridcolor='rgba(255, 255, 255, 0.04)',
+                       autorange=False, range=[data_minima, data_maxima],
+                       rangeslider=dict(visible=True, thickness=0.07),
+                       rangeselector=seletor_intervalo(curso),
+                       )
+    gantt.update_coloraxes(showscale=False)
+    gantt.update_traces(marker_line_width=0,
+                        customdata=customdata,
+                        hovertemplate='<b>Aula %{customdata[1]}</b><br>'
+                                      'Módulo %{customdata[0]}<br>'
+                                      'Início: %{base}<br>'
+                                      'Término: %{x}<br>'
+                                      + detalhe
+                        )
+
+    return compactar_figura(gantt), paginas
+
+
+@cache_figuras(maxsize=32)
+def figuras_indicadores(sigla, modulo_selecionado, hoje=None):
+    curso = CURSOS_POR_SIGLA[sigla]
+    dados = obter_dados()
+    filtrado = filtrar_modulos(dados, curso, modulo_selecionado)
+    aulas = filtrar_aulas(dados, curso, modulo_selecionado)
+
+# Operação com o df para gerar o gráfico
+    data_minima = filtrado['data inicial'].min()
+    data_maxima = hoje or date.today()
+# Linhas e Indicadores
+# Configurando as linhas: um trace WebGL por situação (concluída ou não, pelo progresso final de cada ID,
+# calculado na carga dos dados), com as aulas separadas por lacunas, em vez de um trace por ID
+    concluida = dados.progresso_final.reindex(filtrado['ID'].astype(str)).to_numpy() == 100
+
+# Plotando
+    linhas = go.Figure()
+    for nome, mascara, cor in [('Concluída', concluida, curso.cor), ('Em andamento', ~concluida, '#ffd700')]:
+        segmentos = segmentos_separados(filtrado[mascara], 'ID')
+        linhas.add_trace(go.Scattergl(
+            x=segmentos['data final'],
+            y=segmentos['progresso'],
+            customdata=segmentos[['ID', 'Aula', 'Módulo']].astype(object),
+            name=nome,
+            mode='lines+markers',
+            line_color=cor,
+        ))
+
+    linhas.update_layout(grafico_config,
+                         margin_t=60,
+                         title={'text': 'Progresso das aulas', 'x': 0.5},
+                         )
+    linhas.update_yaxes(title='Progresso (%)', range=[0, 100], gridcolor='rgba(255, 255, 255, 0.04)')
+    linhas.update_xaxes(showgrid=False,
+                        title='Seletor de intervalo', autorange=False, range=[data_minima, data_maxima],
+                        rangeslider=dict(visible=True, thickness=0.07),
+                        rangeselector=seletor_intervalo(curso),
+                        )
+
+    linhas.update_traces(
+        hovertemplate='<b>Data</b> %{x}<br>'
+                      '<b>Progresso</b> %{y:.0f}%<br>'  # '.0f' formata como inteiro
+                      '<b>Aula</b> %{customdata[1]}<br>'  # 'Aula' está em customdata[1]
+                      '<b>Módulo</b> %{customdata[2]}<br>'  # 'Módulo' está em customdata[2]
+                      '<extra>%{customdata[0]}</extra>'  # ID da aula, no lugar do nome do trace
+    )
+
+# Configurando df e cores do Indicador Progresso
+    media_progresso = aulas['progresso_maximo'].astype('float64').mean()
+
+    def cor_gauge_progresso(media_progresso):
+        if media_progresso == 100:
+            return curso.cor
+        else:
+            return '#ffd700'
+
+# Plotando
+    gauge_progresso = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=media_progresso,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        gauge={'axis': {'range': [0, 100]},
+               'bar': {'color': cor_gauge_progresso(media_progresso)},
+               }
+    ))
+
+    gauge_progresso.update_layout(grafico_config,
+                                  margin=dict(r=50, l=20, b=10, t=60),
+                                  title={'text': 'Progresso Total (%)', 'x': 0.5},
+                                  )
+
+# Configurando df e cores do Indicador Duração
+    duracao = aulas['duracao']
+    media_duracao = duracao.mean().days
+    duracao_minima = duracao.min().days
+    duracao_maxima = duracao.max().days
+
+    def cor_gauge_duracao(media_duracao):
+        if media_duracao <= 100:
+            return curso.cor
+        elif 100 < media_duracao <= 200:
+            return '#ffd700'
+        else:
+            return 'red'
+
+# Plotando
+    gauge_duracao = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=media_duracao,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        gauge={'axis': {'range': [duracao_minima, duracao_maxima]}, 'bar': {'color': cor_gauge_duracao(media_duracao)}}
+    ))
+
+    gauge_duracao.update_layout(grafico_config,
+                                title={'text': 'Produção (dias)', 'x': 0.5},
+                                )
+    if curso.margem_duracao is not None:
+        gauge_duracao.update_layout(margin=curso.margem_duracao)
+
+    return compactar_figura(linhas), compactar_figura(gauge_progresso), compactar_figura(gauge_duracao)
+
+
+@cache_figuras(maxsize=32)
+def figuras_colaboradores(sigla, modulo_selecionado):
+    curso = CURSOS_POR_SIGLA[sigla]
+    dados = obter_dados()
+    filtrado = filtrar_modulos(dados, curso, modulo_selecionado)
+    resumo = filtrar_aulas(dados, curso, modulo_selecionado)
+
+#  Barras (3)
+# Modificação para Aula por Status (uma linha do resumo por aula)
+    aulas = resumo.groupby(['Status'], observed=True).size().to_frame(name='Aula').reset_index()
+# Plotando
+    barras = px.bar(
+        aulas,
+        x='Status',
+        y='Aula',
+        labels=False,
+        color='Status',
+        color_discrete_map=cores_status(curso),
+        text_auto=True,
+        hover_data=None,
+    )
+
+    barras.update_layout(grafico_config,
+                         title={'text': 'Aulas por Status', 'x': 0.5},
+                         )
+    barras.update_yaxes(showticklabels=False, showgrid=False, title=None, zeroline=False)
+    barras.update_xaxes(title=None)
+    barras.update_traces(textfont_size=20, textfont_color='#D3D3D3', marker_line_width=0)
+
+# Modificação para Aulas por Professor(a)
+    professor = resumo.groupby(['curso', 'Professor', 'Módulo', 'Status'], observed=True).size().to_frame(name='Aula')
+    professor = professor.reset_index()
+# Plotando
+    professores = px.bar(
+        professor,
+        y='Professor',
+        x='Aula',
+        color='Status',
+        orientation='h',
+        color_discrete_map=cores_status(curso),
+        hover_data={'Módulo': True, 'Status': False, 'Aula': True},
+        text_auto=True,
+    )
+
+    professores.update_layout(grafico_config,
+                              title={'text': 'Aulas por professor(a)', 'x': 0.5},
+                              **curso.layout_professores,
+                              )
+
+    professores.update_xaxes(showticklabels=False, showgrid=False, title=None, zeroline=False)
+    professores.update_yaxes(title=None)
+    professores.update_traces(textfont_size=12, textfont_color='#D3D3D3', marker_line_width=0,
+                              customdata=np.stack((professor['Módulo'],
+                                                   professor['Aula']), axis=-1),
+                              hovertemplate='<b>Professor(a) %{y}</b><br>'
+                                            'Módulo %{customdata[0]}<br>'
+                                            '%{x} aulas<br>')
+
+# Modificação para Subtarefas por responsável
+    responsavel = filtrado.groupby(['Responsável', 'Módulo', 'Status'], observed=True).size().to_frame(
+        name='Número de subtarefas')
+    responsavel = responsavel.reset_index()
+
+    ordem = responsavel.groupby('Responsável', observed=True)['Número de subtarefas'].sum()
+    ordem = ordem.sort_values(ascending=True).index
+# Plotando
+    responsaveis = px.bar(
+        responsavel,
+        y='Responsável',
+        x='Número de subtarefas',
+        color='Status',
+        orientation='h',
+        color_discrete_map=cores_status(curso),
+        hover_data={'Módulo': True, 'Status': False},
+        text_auto=True
+    )
+
+    responsaveis.update_layout(grafico_config,
+                               height=1200,
+                               title={'text': 'Subtarefas por Responsável', 'x': 0.5},
+                               )
+
+    responsaveis.update_xaxes(showticklabels=False, showgrid=False, title=None, zeroline=False)
+    responsaveis.update_yaxes(title=None, categoryorder='array', categoryarray=ordem)
+    responsaveis.update_traces(textfont_size=12, textfont_color='#D3D3D3', marker_line_width=0,
+                               customdata=np.stack((responsavel['Responsável'],
+                                                    responsavel['Módulo'],
+                                                    responsavel['Responsável']), axis=-1),
+                               hovertemplate='<b>%{y}</b> <br>'
+                                             'Módulo %{customdata[1]}<br>'
+                                             'Subtarefas: %{x}<br>'
+                               )
+
+    return compactar_figura(barras), compactar_figura(professores), compactar_figura(responsaveis)
+
+
+# layout
+def grafico(tipo, curso, **kwargs):
+    # O callback do servidor grava a figura compacta no dcc.Store; o navegador a expande no dcc.Graph
+    return html.Div([
+        dcc.Store(id={'tipo': 'figura', 'grafico': tipo, 'curso': curso.sigla}),
+        dcc.Graph(id={'tipo': 'grafico', 'grafico': tipo, 'curso': curso.sigla}, **kwargs),
+    ])
+
+
+def layout_curso(curso, **_):
+    tab_gantt = dbc.Row(
+        [
+            dbc.Col(
+                [
+                    # Aparece com uma aula detalhada (clique numa barra)
+                    dbc.Button('Voltar às aulas', id={'tipo': 'voltar-aulas', 'curso': curso.sigla},
+                               size='sm', color='secondary', style=ESTILO_VOLTAR[False]),
+                    dcc.Loading(
+                        grafico('gantt', curso, className='chart-container'),
+                        type='circle', color='#ffd700',
+                    ),
+                    # Páginas de aulas: só a página visível vai ao navegador
+                    dbc.Pagination(id={'tipo': 'paginas-gantt', 'curso': curso.sigla}, max_value=1,
+                                   active_page=1, fully_expanded=False, previous_next=True, size='sm',
+                                   class_name='justify-content-center', style=ESTILO_PAGINAS[False]),
+                ],
+            ),
+        ],
+    )
+
+    tab_indicadores = dbc.Row(
+        [
+            dbc.Col(
+                dcc.Loading(
+                    html.Div(
+                        [grafico('linhas', curso, className='chart-container')],
+                    ), type='circle', color='#ffd700',
+                ), width=9,
+            ),
+            dbc.Col(
+                dcc.Loading(
+                    html.Div(
+                        [
+                            dbc.Row(
+                                dbc.Col(
+                                    [grafico('progresso', curso, className='chart-container2')],
+                                )
+                            ),
+                            dbc.Row(
+                                dbc.Col(
+                                    [grafico('duracao', curso, className='chart-container2')],
+                                )
+                            ),
+                        ],
+                    ), type='circle', color='#ffd700',
+                ), width=3,
+            ),
+        ],
+    )
+
+    tab_colaboradores = dbc.Row(
+        [
+            dbc.Col(
+                dcc.Loading(
+                    html.Div(
+                        [grafico('barras', curso, className='chart-container')],
+                    ), type='circle', color='#ffd700',
+                ), width=4,
+            ),
+            dbc.Col(
+                dcc.Loading(
+                    html.Div(
+                        [grafico('professores', curso, className='chart-container')],
+                    ), type='circle', color='#ffd700',
+                ), width=4,
+            ),
+            dbc.Col(
+                [
+                    dcc.Loading(
+                        children=[
+                            html.Div(
+                                children=[
+                                    html.Div(
+                                        grafico('responsaveis', curso),
+                                        className='chart-container'
+                                    )
+                                ]
+                            )
+                        ], type='circle', color='#ffd700',
+                    )
+                ], width=4,
+            )
+        ]
+    )
+
+    tabs = html.Div(
+        [
+            dbc.Tabs(
+                [
+                    dbc.Tab(tab_gantt, label='Linha do Tempo', tab_id='tabgan'),
+                    dbc.Tab(tab_indicadores, label='Indicadores', tab_id='tabind'),
+                    dbc.Tab(tab_colaboradores, label='Colaboradores', tab_id='tabcol'),
+                ], id={'tipo': 'abas', 'curso': curso.sigla}, active_tab='tabgan'
+            ),
+        ]
+    )
+
+    return dbc.Container(
+        [
+            html.Div(
+                [
+                    dbc.Row(
+                        [
+                            dbc.Col(
+                                [
+                                    html.H2(
+                                        curso.nome,  # title
+                                        className='title',
+                                    ),
+                                ], width=5,
+                            ),
+                            dbc.Col(
+                                [
+                                    dcc.Dropdown(id={'tipo': 'filtro-modulo', 'curso': curso.sigla},
+                                                 options=[{'label': modulo, 'value': modulo}
+                                                          for modulo in df_curso(obter_dados(), curso)['Módulo'].unique()],
+                                                 placeholder='Selecione o Módulo',
+                                                 value=None,
+                                                 multi=True,
+                                                 searchable=True,
+                                                 className='dropdown',
+                                                 ),
+                                ], width=7,
+                            ),
+                        ]
+                    ),
+                    html.Br(),
+                    tabs,
+                    dcc.Store(id={'tipo': 'desenhado', 'aba': 'tabgan', 'curso': curso.sigla}),
+                    dcc.Store(id={'tipo': 'desenhado', 'aba': 'tabind', 'curso': curso.sigla}),
+                    dcc.Store(id={'tipo': 'desenhado', 'aba': 'tabcol', 'curso': curso.sigla}),
+                ],
+                className='page-content',
+            )
+        ],
+        fluid=True,
+    )
+
+
+# Uma página por curso da tabela; o layout é montado a cada visita, com os dados atuais
+for curso in CURSOS:
+    dash.register_page(
+        f'{__name__}.{curso.sigla}',
+        name=curso.nome,
+        suppress_callback_exceptions=True,
+        external_stylesheets=[dbc.themes.BOOTSTRAP],
+        path=curso.caminho,
+        layout=partial(layout_curso, curso),
+    )
+
+
+expandir_no_navegador({'tipo': 'grafico', 'grafico': MATCH, 'curso': MATCH},
+                      {'tipo': 'figura', 'grafico': MATCH, 'curso': MATCH})
+
+
+# Cada aba só é calculada quando está visível. O dcc.Store guarda o filtro já desenhado
+# na aba, para que voltar a ela sem mudar o filtro não refaça nem reenvie as figuras.
+def filtro_pendente(aba_ativa, aba, modulo_selecionado, filtro_desenhado):
+    if aba_ativa != aba:
+        raise PreventUpdate
+    sigla = ctx.outputs_list[0]['id']['curso']
+    filtro = normalizar_selecao(modulo_selecionado, df_curso(obter_dados(), CURSOS_POR_SIGLA[sigla])['Módulo'].unique())
+    if filtro_desenhado is not None and filtro_desenhado.get('filtro') == (list(filtro) if filtro else None):
+        raise PreventUpdate
+    return sigla, filtro
+
+
+@callback(
+    Output({'tipo': 'figura', 'grafico': 'gantt', 'curso': MATCH}, 'data'),
+    Output({'tipo': 'desenhado', 'aba': 'tabgan', 'curso': MATCH}, 'data'),
+    Output({'tipo': 'voltar-aulas', 'curso': MATCH}, 'style'),
+    Output({'tipo': 'paginas-gantt', 'curso': MATCH}, 'max_value'),
+    Output({'tipo': 'paginas-gantt', 'curso': MATCH}, 'active_page'),
+    Output({'tipo': 'paginas-gantt', 'curso': MATCH}, 'style'),
+    Input({'tipo': 'filtro-modulo', 'curso': MATCH}, 'value'),
+    Input({'tipo': 'abas', 'curso': MATCH}, 'active_tab'),
+    Input({'tipo': 'grafico', 'grafico': 'gantt', 'curso': MATCH}, 'clickData'),
+    Input({'tipo': 'voltar-aulas', 'curso': MATCH}, 'n_clicks'),
+    Input({'tipo': 'paginas-gantt', 'curso': MATCH}, 'active_page'),
+    State({'tipo': 'desenhado', 'aba': 'tabgan', 'curso': MATCH}, 'data'),
+)
+@cronometrar
+@fixar_dados()
+def atualizar_linha_do_tempo(modulo_selecionado, aba_ativa, clique, _voltar, pagina, filtro_desenhado):
+    disparo = ctx.triggered_id['tipo'] if isinstance(ctx.triggered_id, dict) else None
+    if disparo in ('grafico', 'voltar-aulas', 'paginas-gantt'):
+        # Detalhar a aula clicada, voltar à visão por aula ou trocar de página, mantendo o filtro já desenhado
+        if aba_ativa != 'tabgan' or filtro_desenhado is None:
+            raise PreventUpdate
+        detalhada = filtro_desenhado.get('aula')
+        if disparo == 'grafico' and (detalhada is not None or not clique):
+            raise PreventUpdate
+        if disparo == 'voltar-aulas' and detalhada is None:
+            raise PreventUpdate
+        if disparo == 'paginas-gantt' and (detalhada is not None or pagina == filtro_desenhado.get('pagina')):
+            raise PreventUpdate
+        aula = clique['points'][0]['y'] if disparo == 'grafico' else None
+        pagina = pagina if disparo == 'paginas-gantt' else filtro_desenhado.get('pagina', 1)
+        sigla = ctx.outputs_list[0]['id']['curso']
+        filtro = tuple(filtro_desenhado['filtro']) if filtro_desenhado['filtro'] else None
+    else:
+        # Filtro novo: volta à primeira página da visão por aula
+        sigla, filtro = filtro_pendente(aba_ativa, 'tabgan', modulo_selecionado, filtro_desenhado)
+        aula, pagina = None, 1
+    hoje = date.today().isoformat()
+    if aula is not None:
+        # Aula detalhada: a paginação fica escondida e guarda a página para a volta
+        gantt, _ = figuras_linha_do_tempo(sigla, filtro, hoje, aula)
+        return (gantt, {'filtro': filtro, 'aula': aula, 'pagina': pagina}, ESTILO_VOLTAR[True],
+                no_update, no_update, ESTILO_PAGINAS[False])
+    gantt, paginas = figuras_linha_do_tempo(sigla, filtro, hoje, pagina=pagina)
+    pagina = min(pagina, paginas)
+    return (gantt, {'filtro': filtro, 'aula': None, 'pagina': pagina}, ESTILO_VOLTAR[False],
+            paginas, pagina, ESTILO_PAGINAS[paginas > 1])
+
+
+@callback(
+    Output({'tipo': 'figura', 'grafico': 'linhas', 'curso': MATCH}, 'data'),
+    Output({'tipo': 'figura', 'grafico': 'progresso', 'curso': MATCH}, 'data'),
+    Output({'tipo': 'figura', 'grafico': 'duracao', 'curso': MATCH}, 'data'),
+    Output({'tipo': 'desenhado', 'aba': 'tabind', 'curso': MATCH}, 'data'),
+    Input({'tipo': 'filtro-modulo', 'curso': MATCH}, 'value'),
+    Input({'tipo': 'abas', 'curso': MATCH}, 'active_tab'),
+    State({'tipo': 'desenhado', 'aba': 'tabind', 'curso': MATCH}, 'data'),
+)
+@cronometrar
+@fixar_dados()
+def atualizar_indicadores(modulo_selecionado, aba_ativa, filtro_desenhado):
+    sigla, filtro = filtro_pendente(aba_ativa, 'tabind', modulo_selecionado, filtro_desenhado)
+    return *figuras_indicadores(sigla, filtro, date.today().isoformat()), {'filtro': filtro}
+
+
+@callback(
+    Output({'tipo': 'figura', 'grafico': 'barras', 'curso': MATCH}, 'data'),
+    Output({'tipo': 'figura', 'grafico': 'professores', 'curso': MATCH}, 'data'),
+    Output({'tipo': 'figura', 'grafico': 'responsaveis', 'curso': MATCH}, 'data'),
+    Output({'tipo': 'desenhado', 'aba': 'tabcol', 'curso': MATCH}, 'data'),
+    Input({'tipo': 'filtro-modulo', 'curso': MATCH}, 'value'),
+    Input({'tipo': 'abas', 'curso': MATCH}, 'active_tab'),
+    State({'tipo': 'desenhado', 'aba': 'tabcol', 'curso': MATCH}, 'data'),
+)
+@cronometrar
+@fixar_dados()
+def atualizar_colaboradores(modulo_selecionado, aba_ativa, filtro_desenhado):
+    sigla, filtro = filtro_pendente(aba_ativa, 'tabcol', modulo_selecionado, filtro_desenhado)
+    return *figuras_colaboradores(sigla, filtro), {'filtro': filtro}
+
+
+# Aquecimento: as três abas de cada curso sem filtro e, com `modulos`, com cada módulo sozinho
+@registrar_aquecimento
+def estados_comuns(modulos):
+    hoje, dados = date.today().isoformat(), obter_dados()
+    for curso in CURSOS:
+        universo = df_curso(dados, curso)['Módulo'].unique()
+        filtros = {None}
+        if modulos:
+            filtros |= {normalizar_selecao([modulo], universo) for modulo in universo}
+        for filtro in sorted(filtros, key=lambda filtro: filtro or ()):
+            yield figuras_linha_do_tempo, (curso.sigla, filtro, hoje)
+            yield figuras_indicadores, (curso.sigla, filtro, hoje)
+            yield figuras_colaboradores, (curso.sigla, filtro)
@@ -1,12 +1,18 @@
 import dash
-from dash import callback, dcc, html, Input, Output, State
+from dash import callback, clientside_callback, ctx, dcc, html, ClientsideFunction, Input, Output, State
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
-import pandas as pd
-import numpy as np
 import plotly.express as px
-from datetime import date, timedelta
+from datetime import date
 
-from functools import lru_cache
+from painel.agregacoes import PERIODOS
+from painel.aquecimento import registrar_aquecimento
+from painel.amostragem import altera_intervalo, intervalo_visivel, reduzir_series
+from painel.cache import cache_figuras, normalizar_selecao
+from painel.cursos import CURSOS
+from painel.dados import fixar_dados, obter_dados
+from painel.metricas import cronometrar, etapa
+from painel.serializacao import compactar_figura, expandir_no_navegador
 
 # Estilo
 
@@ -27,35 +33,34 @@ dash.register_page(
     path='/visaogeral',
 )
 
-# dataset
-df_cursos = pd.read_csv('data/df_cursos.csv')
-df_cursos['data final'] = pd.to_datetime(df_cursos['data final'], format='ISO8601')
-df_cursos['data inicial'] = pd.to_datetime(df_cursos['data inicial'], format='ISO8601')
+# dataset (compartilhado entre as páginas; consultado a cada uso, pode ser recarregado)
+def cursos_disponiveis():
+    return obter_dados().df_cursos['curso'].unique()
 
-prog_aulas_curso = pd.read_csv('data/prog_aulas_curso.csv')
-prog_aulas_curso['data final'] = pd.to_datetime(prog_aulas_curso['data final'], format='ISO8601')
 
-data_min = prog_aulas_curso['data final'].min()
-data_max = date.today()
+def eixo_completo(dados, hoje):
+    # Do primeiro dia com aula concluída até hoje, calculado a cada figura (não na importação)
+    return [dados.prog_aulas_curso['data final'].min(), hoje or date.today()]
 
-cores_cursos = {
-    'Gestão e Controle de Negócios': '#ff5c00',
-    'Gestão de Recursos Humanos': '#FF0023',
-    'Qualidade e Tecnologias da Carne': '#DB00FF'
-}
 
-@lru_cache(maxsize=32)
-def grafico_geral(curso_selecionado):
-    prog_aulas_curso_filtrado = prog_aulas_curso.copy()
-    if curso_selecionado:
-        prog_aulas_curso_filtrado = prog_aulas_curso[prog_aulas_curso['curso'].isin(curso_selecionado)]
+cores_cursos = {curso.nome: curso.cor_geral for curso in CURSOS}
+
+@cache_figuras(maxsize=32)
+def grafico_geral(curso_selecionado, intervalo=None, hoje=None):
+    # Curvas acumuladas pré-calculadas na carga dos dados, reduzidas para a janela visível
+    dados = obter_dados()
+    with etapa('dados'):
+        progressao = dados.progressao
+        if curso_selecionado:
+            progressao = progressao[progressao['curso'].isin(curso_selecionado)]
+        progressao = reduzir_series(progressao, 'data final', 'progresso_acumulado', 'curso', intervalo=intervalo)
 
     # Plotagem do gráfico
-    g_geral = px.line(prog_aulas_curso_filtrado,
+    g_geral = px.line(progressao,
                       x='data final',
                       y='progresso_acumulado',
                       color='curso',
-                      hover_data={'Aula': True},
+                      custom_data=['curso', 'Módulo', 'Aula'],
                       color_discrete_map=cores_cursos
                       )
 
@@ -66,7 +71,7 @@ def grafico_geral(curso_selecionado):
 
     g_geral.update_yaxes(title='Aulas Finalizadas', showgrid=False)
     g_geral.update_xaxes(title='Seletor de intervalo', gridcolor='rgba(255, 255, 255, 0.04)',
-                         autorange=False, range=[data_min, data_max],
+                         autorange=False, range=intervalo or eixo_completo(dados, hoje),
                          rangeslider=dict(visible=True, thickness=0.07),
                          rangeselector=dict(buttons=list([
                              dict(count=1, label='mês', step='month', stepmode='todate', ),
@@ -76,50 +81,27 @@ def grafico_geral(curso_selecionado):
                              bgcolor='rgba(0, 0, 0, 0)', activecolor='#007eff')
                          )
     g_geral.update_traces(mode='lines+markers',
-                          customdata=np.stack(
-                              (prog_aulas_curso['curso'], prog_aulas_curso['Módulo'], prog_aulas_curso['Aula']),
-                              axis=-1),
                           hovertemplate='Módulo %{customdata[1]}<br>'
                                         'Aula: %{customdata[2]}<br>'
                                         'Concluída em %{x}<br>'
                           )
 
-    return g_geral.to_dict()
-
-@lru_cache(maxsize=64)
-def aulas_concluidas_periodo(curso_selecionado, periodo='dia'):
-    prog_aulas_curso_filtrado = prog_aulas_curso.copy()
-    if curso_selecionado:
-        prog_aulas_curso_filtrado = prog_aulas_curso[prog_aulas_curso['curso'].isin(curso_selecionado)]
-
-    if periodo == 'dia':
-        aulas_concluidas = prog_aulas_curso_filtrado.groupby(['data final', 'curso'])['progresso_100'].sum().reset_index()
-        eixo_x = 'data final'
-    elif periodo == 'semana':
-        prog_aulas_curso['Ano'] = prog_aulas_curso['data final'].dt.year
-        prog_aulas_curso['Semana'] = prog_aulas_curso['data final'].dt.isocalendar().week
-        # Encontrar a primeira quinta-feira de cada semana
-        def encontrar_primeira_quinta(row):
-            ano = row['Ano']
-            semana = row['Semana']
-            data_referencia = date(ano, 1, 1)  # Data inicial do ano
-            delta_dias = (7 - data_referencia.weekday()) % 7 + (semana - 1) * 7 + 3  # 3 representa a quarta-feira
-            return data_referencia + timedelta(days=delta_dias)
-        prog_aulas_curso['Semana'] = prog_aulas_curso.apply(encontrar_primeira_quinta, axis=1)
-        # Agrupar por semana e curso, somando progresso_100
-        aulas_concluidas = prog_aulas_curso.groupby(['Semana', 'curso'])['progresso_100'].sum().reset_index()
-        eixo_x = 'Semana'
-    elif periodo == 'mes':
-        prog_aulas_curso_filtrado['mes'] = prog_aulas_curso_filtrado['data final'].dt.month
-        prog_aulas_curso_filtrado['ano'] = prog_aulas_curso_filtrado['data final'].dt.year
-        aulas_concluidas = prog_aulas_curso_filtrado.groupby(['ano', 'mes', 'curso'])['progresso_100'].sum().reset_index()
-        aulas_concluidas['mes'] = pd.to_datetime(
-            {'year': aulas_concluidas['ano'], 'month': aulas_concluidas['mes'], 'day': 1}).dt.date
-        aulas_concluidas = aulas_concluidas.rename(columns={'mes': 'Data Inicial do Mês'})
-        eixo_x = 'Data Inicial do Mês'
-    else:
+    return compactar_figura(g_geral)
+
+@cache_figuras(maxsize=64)
+def aulas_concluidas_periodo(curso_selecionado, periodo='dia', intervalo=None, hoje=None):
+    dados = obter_dados()
+    if periodo not in dados.producao:
         raise ValueError("Período inválido. Os valores válidos são: 'dia', 'semana', 'mes'.")
 
+    # Somas por dia/semana/mês já agregadas na carga dos dados: só resta filtrar os cursos
+    with etapa('dados'):
+        aulas_concluidas = dados.producao[periodo]
+        if curso_selecionado:
+            aulas_concluidas = aulas_concluidas[aulas_concluidas['curso'].isin(curso_selecionado)]
+        eixo_x = aulas_concluidas.columns[0]
+        aulas_concluidas = reduzir_series(aulas_concluidas, eixo_x, 'progresso_100', 'curso', intervalo=intervalo)
+
     g_concluidas = px.line(aulas_concluidas,
                            x=eixo_x,
                            y='progresso_100',
@@ -132,7 +114,7 @@ def aulas_concluidas_periodo(curso_selecionado, periodo='dia'):
                                )
     g_concluidas.update_yaxes(title='Aulas Finalizadas', showgrid=False)
     g_concluidas.update_xaxes(title='Seletor de intervalo', gridcolor='rgba(255, 255, 255, 0.04)',
-                              autorange=False, range=[data_min, data_max],
+                              autorange=False, range=intervalo or eixo_completo(dados, hoje),
                               rangeslider=dict(visible=True, thickness=0.07),
                               rangeselector=dict(buttons=list([
                                   dict(count=1, label='mês', step='month', stepmode='todate', ),
@@ -145,19 +127,22 @@ def aulas_concluidas_periodo(curso_selecionado, periodo='dia'):
                                              'Aula(s) Conluída(s) %{y}<br>'
     )
 
-    return g_concluidas.to_dict()
+    return compactar_figura(g_concluidas)
 
 # layout
 tab_geral = dbc.Row(
     [
         dbc.Col(
             dcc.Loading(
-                dcc.Graph(
-                    id='g-geral',
-                    # config={'displayModeBar': False},
-                    # className='chart-card',
-                    style={'height': '550px'},
-                ),
+                [
+                    dcc.Store(id='figura-geral'),
+                    dcc.Graph(
+                        id='g-geral',
+                        # config={'displayModeBar': False},
+                        # className='chart-card',
+                        style={'height': '550px'},
+                    ),
+                ],
                 type='circle',
                 color='#f79500',
             ),
@@ -170,12 +155,15 @@ tab_concluidas = dbc.Row(
         dbc.Col(
             [
                 dcc.Loading(
-                    dcc.Graph(
-                        id='g-concluidas',
-                        # config={'displayModeBar': False},
-                        # className='chart-card',
-                        style={'height': '550px'},
-                    ),
+                    [
+                        dcc.Store(id='figuras-concluidas'),
+                        dcc.Graph(
+                            id='g-concluidas',
+                            # config={'displayModeBar': False},
+                            # className='chart-card',
+                            style={'height': '550px'},
+                        ),
+                    ],
                     type='circle', color='#f79500',
                 ),
             ], width=11,
@@ -206,92 +194,108 @@ tabs_visao = html.Div(
     ]
 )
 
-layout = dbc.Container(
-    [
-        html.Div(
-            [
-                dbc.Row(
-                    [
-                        dbc.Col(
-                            [
-                                html.H2(
-                                    'Visão Geral',  # titulo
-                                    className='title',
-                                ),
-                            ], width=5,
-                        ),
-                        dbc.Col(
-                            [
-                                dcc.Dropdown(id='filtro-cursos',  # filtro
-                                             options=[{'label': curso, 'value': curso}
-                                                      for curso in df_cursos['curso'].unique()],
-                                             placeholder='Selecione o Curso',
-                                             value=None,
-                                             multi=True,
-                                             searchable=True,
-                                             className='dropdown',
-                                             ),
-                            ], width=7,
-                        ),
-                    ]
-                ),
-                html.Br(),
-                tabs_visao,
-            ],
-            className='page-content',
-        ),
-    ],
-    fluid=True,
-)
+# Função: as opções do filtro acompanham os dados recarregados
+def layout(**_):
+    return dbc.Container(
+        [
+            html.Div(
+                [
+                    dbc.Row(
+                        [
+                            dbc.Col(
+                                [
+                                    html.H2(
+                                        'Visão Geral',  # titulo
+                                        className='title',
+                                    ),
+                                ], width=5,
+                            ),
+                            dbc.Col(
+                                [
+                                    dcc.Dropdown(id='filtro-cursos',  # filtro
+                                                 options=[{'label': curso, 'value': curso}
+                                                          for curso in cursos_disponiveis()],
+                                                 placeholder='Selecione o Curso',
+                                                 value=None,
+                                                 multi=True,
+                                                 searchable=True,
+                                                 className='dropdown',
+                                                 ),
+                                ], width=7,
+                            ),
+                        ]
+                    ),
+                    html.Br(),
+                    tabs_visao,
+                ],
+                className='page-content',
+            ),
+        ],
+        fluid=True,
+    )
+
 
 # callback cards and graphs
 
-@callback(
-    Output('g-geral', 'figure'),
+expandir_no_navegador('g-geral', 'figura-geral')
+
+# Dias/Semanas/Meses: as três séries chegam juntas no dcc.Store e a troca acontece no navegador
+# (assets/js/visao_geral.js), sem ida ao servidor
+clientside_callback(
+    ClientsideFunction(namespace='painel', function_name='alternar_periodo'),
     Output('g-concluidas', 'figure'),
     Output('btn-dia', 'active'),  # Outputs para atualizar o estado dos botões
     Output('btn-semana', 'active'),
     Output('btn-mes', 'active'),
-    Input('filtro-cursos', 'value'),
+    Input('figuras-concluidas', 'data'),
     Input('btn-dia', 'n_clicks'),  # Inputs para detectar cliques nos botões
     Input('btn-semana', 'n_clicks'),
     Input('btn-mes', 'n_clicks'),
-    State('btn-dia', 'active'),  # States para obter o estado atual dos botões
-    State('btn-semana', 'active'),
+    State('btn-semana', 'active'),  # States para obter o estado atual dos botões
     State('btn-mes', 'active'),
 )
-def atualizar_grafico_geral(curso_selecionado, btn_dia_clicks, btn_semana_clicks, btn_mes_clicks,
-                        btn_dia_active, btn_semana_active, btn_mes_active):
-    ctx = dash.callback_context
-
-    # Detectar qual botão foi clicado
-    button_clicked = ctx.triggered[0]['prop_id'].split('.')[0]
-
-    if button_clicked == 'btn-dia':
-        btn_dia_active = True
-        btn_semana_active = False
-        btn_mes_active = False
-    elif button_clicked == 'btn-semana':
-        btn_dia_active = False
-        btn_semana_active = True
-        btn_mes_active = False
-    elif button_clicked == 'btn-mes':
-        btn_dia_active = False
-        btn_semana_active = False
-        btn_mes_active = True
-
-    # Determinar o período selecionado
-    periodo_selecionado = 'dia'  # Valor padrão
-    if btn_semana_active:
-        periodo_selecionado = 'semana'
-    elif btn_mes_active:
-        periodo_selecionado = 'mes'
-
-    return (
-        grafico_geral(tuple(curso_selecionado) if curso_selecionado else None),
-        aulas_concluidas_periodo(tuple(curso_selecionado) if curso_selecionado else None,
-                                 periodo=periodo_selecionado),
-        btn_dia_active,  # Retornar os estados atualizados dos botões
-        btn_semana_active,
-        btn_mes_active,
-    )
+
+
+def janela_pendente(relayout):
+    # Zoom que não mexe no eixo x não muda a figura: nada a recalcular nem a reenviar
+    if ctx.triggered_id in ('g-geral', 'g-concluidas') and not altera_intervalo(relayout):
+        raise PreventUpdate
+    return intervalo_visivel(relayout)
+
+
+@callback(
+    Output('figura-geral', 'data'),
+    Input('filtro-cursos', 'value'),
+    Input('g-geral', 'relayoutData'),  # Zoom/seletor de intervalo: refaz a figura com a janela visível
+)
+@cronometrar
+@fixar_dados()
+def atualizar_grafico_geral(curso_selecionado, relayout):
+    intervalo = janela_pendente(relayout)
+    return grafico_geral(normalizar_selecao(curso_selecionado, cursos_disponiveis()), intervalo,
+                         hoje=date.today().isoformat())
+
+
+@callback(
+    Output('figuras-concluidas', 'data'),
+    Input('filtro-cursos', 'value'),
+    Input('g-concluidas', 'relayoutData'),
+)
+@cronometrar
+@fixar_dados()
+def atualizar_producao(curso_selecionado, relayout):
+    intervalo = janela_pendente(relayout)
+    curso_selecionado = normalizar_selecao(curso_selecionado, cursos_disponiveis())
+    hoje = date.today().isoformat()
+    return {periodo: aulas_concluidas_periodo(curso_selecionado, periodo=periodo, intervalo=intervalo, hoje=hoje)
+            for periodo in PERIODOS}
+
+
+# Aquecimento: visão sem filtro e cada curso sozinho, com as chaves que os callbacks usam
+@registrar_aquecimento
+def estados_comuns(_modulos):
+    cursos, hoje = cursos_disponiveis(), date.today().isoformat()
+    for selecao in [None, *(normalizar_selecao([curso], cursos) for curso in cursos)]:
+        yield grafico_geral, (selecao, None, hoje)
+        for periodo in PERIODOS:
+            yield aulas_concluidas_periodo, (selecao, periodo, None, hoje)
@@ -0,0 +1,54 @@
+import dash
+from dash import callback, dcc, html, Input, Output
+import dash_bootstrap_components as dbc
+import pandas as pd
+
+from painel.metricas import PAGINA, resumo
+
+# Página de depuração: quantis por callback e etapa, atualizados a cada 5 s.
+# Só existe com PAINEL_METRICAS_PAGINA=1 (fora da barra lateral)
+if PAGINA:
+    dash.register_page(
+        __name__,
+        suppress_callback_exceptions=True,
+        external_stylesheets=[dbc.themes.BOOTSTRAP],
+        path='/metricas',
+        name='Métricas',
+    )
+
+    def tabela_metricas():
+        linhas = []
+        for metrica, rotulos, contagem, soma, quantis in resumo():
+            escala, unidade = (1000, 'ms') if metrica.endswith('_segundos') else (1 / 1024, 'kB')
+            linhas.append({
+                'Callback': rotulos.get('callback'),
+                'Etapa': rotulos.get('etapa', 'resposta (bytes)'),
+                'Execuções': contagem,
+                'Média': f'{soma / contagem * escala:.1f} {unidade}',
+                **{f'p{round(quantil * 100)}': f'{valor * escala:.1f} {unidade}' for quantil, valor in quantis.items()},
+            })
+        if not linhas:
+            return html.P('Nenhum callback executado ainda.')
+        return dbc.Table.from_dataframe(pd.DataFrame(linhas), striped=True, bordered=True, hover=True, size='sm')
+
+    layout = dbc.Container(
+        [
+            html.Div(
+                [
+                    html.H2('Métricas', className='title'),
+                    html.Br(),
+                    dcc.Interval(id='intervalo-metricas', interval=5000),
+                    html.Div(id='tabela-metricas'),
+                ],
+                className='page-content',
+            ),
+        ],
+        fluid=True,
+    )
+
+    @callback(
+        Output('tabela-metricas', 'children'),
+        Input('intervalo-metricas', 'n_intervals'),
+    )
+    def atualizar_metricas(_):
+        return tabela_metricas()
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+
+
+def quinta_feira_da_semana(datas):
+    # Âncora da semana ISO de cada data: segunda-feira + 3 dias (vetorizado, sem apply por linha)
+    return datas.dt.normalize() - pd.to_timedelta(datas.dt.weekday - 3, unit='D')
+
+
+def inicio_do_mes(datas):
+    return datas.dt.to_period('M').dt.to_timestamp()
+
+
+# Período -> (coluna do eixo x, função que leva cada data ao início do seu intervalo)
+PERIODOS = {
+    'dia': ('data final', lambda datas: datas),
+    'semana': ('Semana', quinta_feira_da_semana),
+    'mes': ('Data Inicial do Mês', inicio_do_mes),
+}
+
+
+def producao_por_periodo(prog_aulas_curso):
+    # Aulas concluídas por curso em cada dia/semana/mês, calculadas uma vez na carga dos dados:
+    # qualquer seleção de cursos passa a ser um filtro sobre poucas linhas já somadas
+    producao = {}
+    for periodo, (coluna, inicio_intervalo) in PERIODOS.items():
+        intervalo = inicio_intervalo(prog_aulas_curso['data final']).rename(coluna)
+        producao[periodo] = (prog_aulas_curso.groupby([intervalo, 'curso'], observed=True)['progresso_100']
+                             .sum().reset_index())
+    return producao
+
+
+def curvas_progressao(prog_aulas_curso):
+    # Curva acumulada (progresso_acumulado) de cada curso, ordenada por data, para o gráfico geral
+    colunas = ['data final', 'curso', 'Módulo', 'Aula', 'progresso_acumulado']
+    return prog_aulas_curso.sort_values(['curso', 'data final'], kind='stable')[colunas].reset_index(drop=True)
+
+
+def progresso_final_por_id(df_cursos):
+    # Progresso da última linha de cada ID (como df[df['ID'] == id]['progresso'].iloc[-1], inclusive NaN),
+    # calculado uma vez na carga: colorir as linhas do gráfico vira uma consulta por índice
+    ultimas = df_cursos.drop_duplicates('ID', keep='last')
+    return pd.Series(ultimas['progresso'].to_numpy(), index=ultimas['ID'].astype(str), name='progresso')
+
+
+def resumo_por_aula(df_cursos):
+    # Uma linha por ID (aula), na ordem de aparição, com o que os gráficos dos cursos derivavam a cada
+    # chamada: período da primeira à última subtarefa, duração, progresso máximo e final, subtarefas.
+    # curso, Módulo, Aula, Professor e Status são os mesmos em todas as linhas de um ID
+    aulas = df_cursos.groupby('ID', observed=True, sort=False).agg(**{
+        'curso': ('curso', 'first'),
+        'Módulo': ('Módulo', 'first'),
+        'Aula': ('Aula', 'first'),
+        'Professor': ('Professor', 'first'),
+        'Status': ('Status', 'first'),
+        'data inicial': ('data inicial', 'min'),
+        'data final': ('data final', 'max'),
+        'progresso_maximo': ('progresso', 'max'),
+        'subtarefas': ('Subtarefa', 'count'),
+    }).reset_index()
+    aulas['duracao'] = aulas['data final'] - aulas['data inicial']
+    aulas['progresso_final'] = progresso_final_por_id(df_cursos).reindex(aulas['ID'].astype(str)).to_numpy()
+    return aulas
+
+
+def segmentos_separados(df, chave):
+    # Linhas de cada valor de `chave` em sequência (ordem de aparição), com uma linha vazia
+    # (NaN/NaT) entre grupos: num único trace de linha, o plotly não liga pontos através da lacuna
+    codigos = pd.factorize(df[chave])[0]
+    ordem = np.argsort(codigos, kind='stable')
+    codigos = codigos[ordem]
+    quebras = np.flatnonzero(np.diff(codigos)) + 1
+    # Cada linha avança uma posição por quebra anterior a ela
+    destino = np.arange(len(df)) + np.searchsorted(quebras, np.arange(len(df)), side='right')
+    segmentos = df.iloc[ordem].set_axis(destino)
+    return segmentos.reindex(pd.RangeIndex(len(df) + len(quebras)))
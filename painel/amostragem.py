@@ -0,0 +1,86 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# Pontos por série enviados ao navegador: acima disso a série é reduzida por LTTB.
+# Com zoom, a janela visível ganha até o mesmo número de pontos, além da visão geral.
+PONTOS_POR_SERIE = int(os.environ.get('PAINEL_PONTOS_POR_SERIE', 1000))
+# Aulas (linhas do eixo y) por página da linha do tempo dos cursos
+AULAS_POR_PAGINA = int(os.environ.get('PAINEL_AULAS_POR_PAGINA', 50))
+
+
+def lttb(x, y, limite):
+    # Largest-Triangle-Three-Buckets: índices de `limite` pontos que preservam o formato da curva.
+    # Primeiro e último pontos sempre ficam; de cada balde fica o ponto que forma o maior triângulo
+    # com o ponto escolhido no balde anterior e a média do balde seguinte.
+    n = len(x)
+    if limite >= n or limite < 3:
+        return np.arange(n)
+
+    bordas = np.linspace(1, n - 1, limite - 1).astype(np.int64)
+    indices = np.empty(limite, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    anterior = 0
+    for balde in range(limite - 2):
+        inicio, fim = bordas[balde], bordas[balde + 1]
+        proximo_fim = bordas[balde + 2] if balde + 2 < len(bordas) else n
+        media_x = x[fim:proximo_fim].mean()
+        media_y = y[fim:proximo_fim].mean()
+        areas = np.abs((x[anterior] - media_x) * (y[inicio:fim] - y[anterior])
+                       - (x[anterior] - x[inicio:fim]) * (media_y - y[anterior]))
+        anterior = inicio + int(areas.argmax())
+        indices[balde + 1] = anterior
+    return indices
+
+
+def _posicoes_reduzidas(datas, valores, limite, intervalo):
+    x = datas.to_numpy('datetime64[ns]')
+    eixo = x.astype(np.int64).astype(np.float64)
+    y = valores.to_numpy(np.float64)
+    posicoes = lttb(eixo, y, limite)
+    if intervalo is not None:
+        # Janela visível em resolução própria, com um ponto de cada lado para a linha chegar às bordas
+        inicio, fim = np.searchsorted(x, np.array(intervalo, dtype='datetime64[ns]'), side='left')
+        inicio, fim = max(inicio - 1, 0), min(fim + 1, len(x))
+        posicoes = np.union1d(posicoes, lttb(eixo[inicio:fim], y[inicio:fim], limite) + inicio)
+    return posicoes
+
+
+def reduzir_series(df, x, y, grupo, limite=PONTOS_POR_SERIE, intervalo=None):
+    # Reduz cada série (um valor de `grupo`, ordenada por `x`) a no máximo `limite` pontos no histórico
+    # inteiro + `limite` pontos dentro de `intervalo`: o tamanho da figura não cresce com o histórico
+    partes = [serie.iloc[_posicoes_reduzidas(serie[x], serie[y], limite, intervalo)]
+              for _, serie in df.groupby(grupo, observed=True, sort=False)]
+    return pd.concat(partes) if partes else df
+
+
+def intervalo_visivel(relayout, eixo='xaxis'):
+    # Janela do eixo x depois de zoom, arraste, seletor de intervalo ou rangeslider (relayoutData),
+    # em dias inteiros para a chave do cache. None = histórico inteiro.
+    if not relayout or relayout.get(f'{eixo}.autorange'):
+        return None
+    limites = relayout.get(f'{eixo}.range') or [relayout.get(f'{eixo}.range[0]'), relayout.get(f'{eixo}.range[1]')]
+    if not isinstance(limites, (list, tuple)) or len(limites) != 2 or None in limites:
+        return None
+    # relayoutData vem do navegador: limites que não são datas também valem como histórico inteiro
+    try:
+        inicio, fim = (pd.Timestamp(limite) for limite in limites)
+        if pd.isna(inicio) or pd.isna(fim):
+            return None
+        return inicio.floor('D').date().isoformat(), fim.ceil('D').date().isoformat()
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def altera_intervalo(relayout, eixo='xaxis'):
+    # Se o relayoutData mexeu no eixo x (zoom, arraste, autorange); legenda, eixo y, modo de
+    # hover e 'autosize' não mudam os pontos que precisam ser enviados
+    return bool(relayout) and any(chave.startswith((f'{eixo}.range', f'{eixo}.autorange')) for chave in relayout)
+
+
+def paginar(df, pagina, por_pagina=AULAS_POR_PAGINA):
+    # Linhas da página `pagina` (a partir de 1, limitada à última) e o total de páginas
+    paginas = max(-(-len(df) // por_pagina), 1)
+    pagina = min(max(pagina, 1), paginas)
+    return df.iloc[(pagina - 1) * por_pagina:pagina * por_pagina], paginas
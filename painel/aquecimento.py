@@ -0,0 +1,107 @@
+import logging
+import os
+import threading
+import time
+from collections import Counter
+
+from painel.cache import CONFIG_CACHE, cache, estatisticas_cache
+from painel.dados import fixar_dados, obter_dados
+
+logger = logging.getLogger(__name__)
+
+# Aquecimento do cache de figuras na subida do worker: as visões sem filtro e cada seleção de um
+# curso/módulo são montadas em segundo plano, antes do primeiro acesso.
+# PAINEL_AQUECIMENTO=0 desliga; PAINEL_AQUECIMENTO_MODULOS=0 aquece só as visões sem filtro e por curso.
+AQUECIMENTO = os.environ.get('PAINEL_AQUECIMENTO', '1') != '0'
+AQUECER_MODULOS = os.environ.get('PAINEL_AQUECIMENTO_MODULOS', '1') != '0'
+
+# Backends vistos por todos os workers: basta um worker aquecer cada versão dos dados
+_COMPARTILHADOS = ('FileSystemCache', 'RedisCache')
+# Validade (segundos) da reserva de quem está aquecendo, renovada durante o aquecimento: se o worker
+# morrer no meio, outro assume depois disso. O marcador de concluído vale o TTL das figuras
+RESERVA = 60
+
+# Geradores de (função com cache, argumentos), registrados pelas páginas
+_estados = []
+relatorio = {}
+
+
+def registrar_aquecimento(estados):
+    # `estados(modulos)` gera (função, argumentos) com os argumentos já normalizados como no callback
+    _estados.append(estados)
+    return estados
+
+
+def aquecer(renovar=None):
+    # `renovar()` é chamada após cada figura (renova a reserva no cache compartilhado)
+    versao = obter_dados().versao
+    inicio = time.perf_counter()
+    faltas = sum(contadores['faltas'] for contadores in estatisticas_cache().values())
+    por_funcao = Counter()
+    for estados in _estados:
+        for funcao, argumentos in estados(AQUECER_MODULOS):
+            try:
+                funcao(*argumentos)
+            except Exception:
+                logger.warning('Aquecimento de %s%r falhou', funcao.__name__, argumentos, exc_info=True)
+                continue
+            por_funcao[funcao.__name__] += 1
+            if renovar is not None:
+                renovar()
+    # Faltas durante o aquecimento = figuras montadas (inclui as de requisições simultâneas)
+    montadas = sum(contadores['faltas'] for contadores in estatisticas_cache().values()) - faltas
+
+    relatorio.update(versao=versao, duracao=time.perf_counter() - inicio, figuras=sum(por_funcao.values()),
+                     montadas=montadas, por_funcao=dict(por_funcao))
+    logger.info('Aquecimento dos dados %s: %d chamadas (%d montadas, as demais já no cache) em %.1f s',
+                versao, relatorio['figuras'], montadas, relatorio['duracao'])
+    return relatorio
+
+
+def _reservar(chave):
+    if cache.add(chave, os.getpid(), timeout=RESERVA):
+        return True
+    # O add do FileSystemCache não considera entradas vencidas: a reserva de um worker que morreu
+    # continuaria bloqueando. Vencida, é apagada e disputada de novo
+    if cache.get(chave) is None:
+        cache.delete(chave)
+        return cache.add(chave, os.getpid(), timeout=RESERVA)
+    return False
+
+
+def _aquecer_uma_vez():
+    tipo = CONFIG_CACHE['CACHE_TYPE'] if cache.app is not None else 'SimpleCache'
+    if tipo == 'NullCache':
+        return
+    with fixar_dados() as dados:
+        if tipo not in _COMPARTILHADOS:
+            aquecer()
+            return
+        concluido, reserva = f'aquecido:{dados.versao}', f'aquecimento:{dados.versao}'
+        # Outro worker já aqueceu (ou está aquecendo) esta versão no cache compartilhado
+        if cache.get(concluido) or not _reservar(reserva):
+            logger.info('Aquecimento dos dados %s feito por outro worker', dados.versao)
+            return
+        renovada = time.monotonic()
+
+        def renovar():
+            nonlocal renovada
+            if time.monotonic() - renovada > RESERVA / 3:
+                cache.set(reserva, os.getpid(), timeout=RESERVA)
+                renovada = time.monotonic()
+
+        try:
+            aquecer(renovar)
+            cache.set(concluido, os.getpid(), timeout=CONFIG_CACHE['CACHE_DEFAULT_TIMEOUT'])
+        finally:
+            cache.delete(reserva)
+
+
+def aquecer_em_segundo_plano():
+    # Chamado na subida do app: o worker já atende requisições enquanto o cache é preenchido.
+    # Com gunicorn --preload, chamar de novo no post_fork (threads não atravessam o fork)
+    if not AQUECIMENTO:
+        return None
+    thread = threading.Thread(target=_aquecer_uma_vez, name='painel-aquecimento', daemon=True)
+    thread.start()
+    return thread
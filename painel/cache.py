@@ -0,0 +1,142 @@
+import hashlib
+import inspect
+import os
+import tempfile
+import threading
+from functools import wraps
+from pathlib import Path
+
+from flask_caching import Cache
+from flask_caching.backends import SimpleCache
+
+from painel.dados import fixar_dados, obter_dados
+from painel.metricas import etapa
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+
+def versao_codigo():
+    # Impressão digital do código do painel: o cache em disco/Redis sobrevive ao processo, e uma figura
+    # montada pelo código anterior (reload do debug, novo deploy, outro checkout) não pode ser reaproveitada.
+    # PAINEL_VERSAO_CODIGO (ex.: o commit do deploy) substitui o hash dos fontes
+    if os.environ.get('PAINEL_VERSAO_CODIGO'):
+        return os.environ['PAINEL_VERSAO_CODIGO']
+    hash_ = hashlib.blake2b(digest_size=6)
+    for arquivo in sorted([RAIZ / 'app.py', *RAIZ.glob('painel/*.py'), *RAIZ.glob('pages/*.py')]):
+        hash_.update(arquivo.relative_to(RAIZ).as_posix().encode())
+        hash_.update(arquivo.read_bytes())
+    return hash_.hexdigest()
+
+
+VERSAO_CODIGO = versao_codigo()
+
+# Cache de figuras compartilhado entre os workers do gunicorn (Flask-Caching).
+# PAINEL_CACHE_FIGURAS escolhe o backend: 'FileSystemCache' (padrão), 'RedisCache',
+# 'SimpleCache' (só o processo atual) ou 'NullCache' (desligado).
+# O prefixo das chaves (figuras e marcador do aquecimento) leva a versão do código.
+CONFIG_CACHE = {
+    'CACHE_TYPE': os.environ.get('PAINEL_CACHE_FIGURAS', 'FileSystemCache'),
+    'CACHE_DIR': os.environ.get('PAINEL_CACHE_FIGURAS_DIR',
+                                os.path.join(tempfile.gettempdir(), 'painel-figuras')),
+    'CACHE_REDIS_URL': os.environ.get('PAINEL_CACHE_FIGURAS_REDIS_URL', 'redis://localhost:6379/0'),
+    'CACHE_DEFAULT_TIMEOUT': int(os.environ.get('PAINEL_CACHE_FIGURAS_TTL', 3600)),  # segundos
+    'CACHE_THRESHOLD': int(os.environ.get('PAINEL_CACHE_FIGURAS_LIMITE', 500)),  # entradas
+    'CACHE_KEY_PREFIX': f'painel:{VERSAO_CODIGO}:',
+}
+
+cache = Cache()
+
+# Funções de figura com cache, por nome, para consultar acertos/faltas
+_funcoes_cacheadas = {}
+
+
+def configurar_cache(server, **config):
+    # Equivale a Cache(server): com cache.app definido o backend também é acessível
+    # fora de uma requisição (aquecimento, benchmarks)
+    cache.app = server
+    cache.init_app(server, config={**CONFIG_CACHE, **config})
+    return cache
+
+
+def normalizar_selecao(selecionados, universo=None):
+    # Chave canônica de um filtro multi-seleção: a ordem de clique e repetições não importam,
+    # e "nada selecionado" e "tudo selecionado" viram a mesma chave (None = sem filtro)
+    if not selecionados:
+        return None
+    selecao = frozenset(selecionados)
+    if universo is not None and selecao >= frozenset(universo):
+        return None
+    return tuple(sorted(selecao))
+
+
+class _Contadores:
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.acertos = 0
+        self.faltas = 0
+        self.geracao = 0
+        # Usado enquanto o Flask-Caching não foi configurado (ex.: scripts sem o app)
+        self.local = SimpleCache(threshold=maxsize, default_timeout=0)
+        self.trava = threading.Lock()
+
+
+def _backend(contadores):
+    return cache.cache if cache.app is not None else contadores.local
+
+
+def cache_figuras(maxsize=32):
+    # Memoiza a figura no cache compartilhado, com a chave
+    # versão do código (prefixo) + nome da função + versão do dataset + argumentos (já normalizados pelo callback)
+    def decorador(funcao):
+        nome = f'{funcao.__module__}.{funcao.__qualname__}'
+        assinatura = inspect.signature(funcao)
+        contadores = _Contadores(maxsize)
+
+        @wraps(funcao)
+        @fixar_dados()
+        def cacheada(*args, **kwargs):
+            # A versão da chave é a mesma que a função lê (obter_dados() fixado durante a chamada)
+            argumentos = assinatura.bind(*args, **kwargs)
+            argumentos.apply_defaults()
+            chave = f'{nome}:{contadores.geracao}:{obter_dados().versao}:{argumentos.args!r}'
+
+            backend = _backend(contadores)
+            with etapa('cache'):
+                figura = backend.get(chave)
+            if figura is not None:
+                with contadores.trava:
+                    contadores.acertos += 1
+                return figura
+
+            with contadores.trava:
+                contadores.faltas += 1
+            with etapa('construcao'):
+                figura = funcao(*args, **kwargs)
+            with etapa('cache'):
+                backend.set(chave, figura)
+            return figura
+
+        def cache_clear():
+            # Invalida só as entradas desta função (as chaves antigas expiram pelo TTL/limite)
+            with contadores.trava:
+                contadores.geracao += 1
+                contadores.acertos = contadores.faltas = 0
+            contadores.local.clear()
+
+        cacheada.cache_clear = cache_clear
+        _funcoes_cacheadas[nome] = contadores
+        return cacheada
+    return decorador
+
+
+def estatisticas_cache():
+    estatisticas = {}
+    for nome, contadores in _funcoes_cacheadas.items():
+        consultas = contadores.acertos + contadores.faltas
+        estatisticas[nome] = {
+            'acertos': contadores.acertos,
+            'faltas': contadores.faltas,
+            'taxa_acerto': contadores.acertos / consultas if consultas else 0.0,
+            'limite': CONFIG_CACHE['CACHE_THRESHOLD'] if cache.app is not None else contadores.maxsize,
+        }
+    return estatisticas
@@ -0,0 +1,30 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class Curso:
+    sigla: str
+    nome: str
+    caminho: str
+    icone: str  # classe do Font Awesome usada na barra lateral
+    cor: str  # destaque das aulas concluídas nas páginas do curso
+    cor_geral: str  # linha do curso na Visão Geral
+    cor_seletor: str = '#ffd700'  # botão ativo do seletor de intervalo
+    # Ajustes de layout que cada página tinha antes de virar página parametrizada
+    margem_duracao: dict = field(default_factory=lambda: dict(r=50, l=20, b=10, t=60), hash=False)  # None: a do tema
+    layout_professores: dict = field(default_factory=dict, hash=False)  # extra no 'Aulas por professor(a)'
+
+
+# Tabela de cursos: cada linha vira uma página (/caminho), um item na barra lateral
+# e uma categoria válida de 'curso' no esquema dos dados
+CURSOS = [
+    Curso(sigla='gcn', nome='Gestão e Controle de Negócios', caminho='/gcn', icone='fa-briefcase',
+          cor='#FF0023', cor_geral='#ff5c00', cor_seletor='#007eff'),
+    Curso(sigla='grh', nome='Gestão de Recursos Humanos', caminho='/grh', icone='fa-users',
+          cor='#FF0023', cor_geral='#FF0023'),
+    Curso(sigla='qtc', nome='Qualidade e Tecnologias da Carne', caminho='/qtc', icone='fa-bacon',
+          cor='#DB00FF', cor_geral='#DB00FF', margem_duracao=None,
+          layout_professores=dict(height=400, margin=dict(r=20, l=20, b=20, t=50))),
+]
+
+CURSOS_POR_SIGLA = {curso.sigla: curso for curso in CURSOS}
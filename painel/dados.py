@@ -0,0 +1,257 @@
+import contextvars
+import hashlib
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+import pandas as pd
+
+from painel.agregacoes import curvas_progressao, producao_por_periodo, progresso_final_por_id, resumo_por_aula
+from painel.esquema import ESQUEMA_CURSOS, ESQUEMA_PROGRESSO, aplicar_esquema, versao_esquema
+from painel.indice import IndiceInvertido, IndiceResumo
+from painel.somente_leitura import somente_leitura
+
+logger = logging.getLogger(__name__)
+
+# Pasta com os CSVs (independente do diretório de trabalho do gunicorn)
+PASTA_DADOS = Path(__file__).resolve().parent.parent / 'data'
+
+ARQUIVO_CURSOS = PASTA_DADOS / 'df_cursos.csv'
+ARQUIVO_PROGRESSO = PASTA_DADOS / 'prog_aulas_curso.csv'
+
+# Cache binário dos CSVs, já no esquema de painel/esquema.py (datas convertidas, categorias).
+# 'pickle' (padrão) não exige dependências extras; 'parquet' e 'feather' precisam do pyarrow.
+PASTA_CACHE = Path(os.environ.get('PAINEL_CACHE_DADOS_DIR', PASTA_DADOS / '.cache'))
+USAR_CACHE = os.environ.get('PAINEL_CACHE_DADOS', '1') != '0'
+FORMATO_CACHE = os.environ.get('PAINEL_FORMATO_CACHE', 'pickle')
+
+# Recarga a quente: uma thread confere os CSVs a cada PAINEL_RECARGA_INTERVALO segundos (0 desliga)
+# e troca os dados quando o conteúdo muda. Callbacks em andamento terminam com a instância que já tinham.
+RECARGA_INTERVALO = float(os.environ.get('PAINEL_RECARGA_INTERVALO', 30))
+
+_FORMATOS = {
+    'pickle': (pd.read_pickle, pd.DataFrame.to_pickle),
+    'parquet': (pd.read_parquet, pd.DataFrame.to_parquet),
+    'feather': (pd.read_feather, pd.DataFrame.to_feather),
+}
+
+
+@dataclass(frozen=True)
+class Dados:
+    """Datasets do painel: uma instância imutável por versão dos CSVs, trocada inteira na recarga."""
+
+    df_cursos: pd.DataFrame
+    prog_aulas_curso: pd.DataFrame
+    # Tabelas derivadas, montadas junto com os datasets (ver montar_dados)
+    producao: dict = field(default_factory=dict, repr=False)
+    progressao: pd.DataFrame = None
+    progresso_final: pd.Series = None
+    aulas: pd.DataFrame = None  # uma linha por aula (ver resumo_por_aula)
+    tempo_carga: float = 0.0
+    # Identifica o conteúdo carregado; entra na chave das figuras em cache
+    versao: str = 'local'
+    _por_curso: dict = field(default_factory=dict, repr=False)
+
+    def curso(self, nome):
+        # Fatia de df_cursos de um curso, criada na primeira consulta e reaproveitada
+        if nome not in self._por_curso:
+            self._por_curso[nome] = somente_leitura(self.df_cursos[self.df_cursos['curso'] == nome])
+        return self._por_curso[nome]
+
+    def aulas_curso(self, nome):
+        # Fatia do resumo por aula de um curso, também reaproveitada
+        chave = ('aulas', nome)
+        if chave not in self._por_curso:
+            self._por_curso[chave] = somente_leitura(self.aulas[self.aulas['curso'] == nome])
+        return self._por_curso[chave]
+
+    def indice(self, nome, aulas=False):
+        # Índice invertido do curso (ou do seu resumo por aula), montado na primeira consulta
+        chave = ('indice', nome, aulas)
+        if chave not in self._por_curso:
+            self._por_curso[chave] = (IndiceResumo(self.aulas_curso(nome), self.curso(nome), self.indice(nome))
+                                      if aulas else IndiceInvertido(self.curso(nome)))
+        return self._por_curso[chave]
+
+    def filtrar(self, nome, filtros, aulas=False):
+        # Linhas do curso (ou do resumo por aula) que atendem aos filtros {coluna: valores selecionados};
+        # sem filtro, a própria fatia. No resumo, filtros por colunas das subtarefas valem pelo ID
+        tabela = self.aulas_curso(nome) if aulas else self.curso(nome)
+        return self.indice(nome, aulas).filtrar(tabela, filtros)
+
+    def memoria(self):
+        # Bytes ocupados por cada dataset (inclui o conteúdo das strings)
+        return {
+            'df_cursos': int(self.df_cursos.memory_usage(deep=True).sum()),
+            'prog_aulas_curso': int(self.prog_aulas_curso.memory_usage(deep=True).sum()),
+            'aulas': int(self.aulas.memory_usage(deep=True).sum()) if self.aulas is not None else 0,
+        }
+
+
+def ler_df_cursos(caminho=ARQUIVO_CURSOS):
+    return aplicar_esquema(pd.read_csv(caminho, index_col=0), ESQUEMA_CURSOS, 'df_cursos')
+
+
+def ler_prog_aulas_curso(caminho=ARQUIVO_PROGRESSO):
+    return aplicar_esquema(pd.read_csv(caminho), ESQUEMA_PROGRESSO, 'prog_aulas_curso')
+
+
+def assinatura_arquivo(caminho):
+    # Hash do conteúdo + versão do esquema: o cache continua válido se só o mtime mudar
+    # (ex.: novo checkout no deploy) e é refeito quando o esquema muda
+    conteudo = hashlib.blake2b(Path(caminho).read_bytes(), digest_size=8).hexdigest()
+    return f'{conteudo}-{versao_esquema()}'
+
+
+def ler_com_cache(caminho, leitor, pasta_cache=PASTA_CACHE, formato=FORMATO_CACHE):
+    caminho = Path(caminho)
+    ler, gravar = _FORMATOS[formato]
+    arquivo_cache = Path(pasta_cache) / f'{caminho.stem}-{assinatura_arquivo(caminho)}.{formato}'
+
+    if arquivo_cache.exists():
+        try:
+            return ler(arquivo_cache)
+        except Exception:
+            logger.warning('Cache %s ilegível, relendo o CSV', arquivo_cache.name, exc_info=True)
+
+    df = leitor(caminho)
+    try:
+        arquivo_cache.parent.mkdir(parents=True, exist_ok=True)
+        # Escrita em arquivo temporário + rename: outro worker nunca lê um cache pela metade
+        temporario = arquivo_cache.with_suffix(f'.{os.getpid()}.tmp')
+        # O feather não guarda índice; o de df_cursos é sempre 0..n-1
+        gravar(df.reset_index(drop=True) if formato == 'feather' else df, temporario)
+        temporario.replace(arquivo_cache)
+        for antigo in arquivo_cache.parent.glob(f'{caminho.stem}-*.{formato}'):
+            if antigo != arquivo_cache:
+                antigo.unlink(missing_ok=True)
+    except (OSError, ImportError):
+        logger.warning('Não foi possível gravar o cache de %s', caminho.name, exc_info=True)
+    return df
+
+
+def montar_dados(df_cursos, prog_aulas_curso, versao='local'):
+    # Tabelas somente leitura (painel/somente_leitura.py): os callbacks filtram e leem sem copiar
+    return Dados(somente_leitura(df_cursos), somente_leitura(prog_aulas_curso),
+                 producao=somente_leitura(producao_por_periodo(prog_aulas_curso)),
+                 progressao=somente_leitura(curvas_progressao(prog_aulas_curso)),
+                 progresso_final=somente_leitura(progresso_final_por_id(df_cursos)),
+                 aulas=somente_leitura(resumo_por_aula(df_cursos)),
+                 versao=versao)
+
+
+def versao_arquivos(*caminhos):
+    return hashlib.blake2b(''.join(assinatura_arquivo(c) for c in caminhos).encode(), digest_size=6).hexdigest()
+
+
+def carregar_dados(usar_cache=USAR_CACHE):
+    inicio = time.perf_counter()
+    if usar_cache:
+        df_cursos = ler_com_cache(ARQUIVO_CURSOS, ler_df_cursos)
+        prog_aulas_curso = ler_com_cache(ARQUIVO_PROGRESSO, ler_prog_aulas_curso)
+    else:
+        df_cursos = ler_df_cursos()
+        prog_aulas_curso = ler_prog_aulas_curso()
+    dados = montar_dados(df_cursos, prog_aulas_curso, versao=versao_arquivos(ARQUIVO_CURSOS, ARQUIVO_PROGRESSO))
+    # O tempo de carga inclui a montagem das tabelas derivadas
+    dados = replace(dados, tempo_carga=time.perf_counter() - inicio)
+
+    memoria = dados.memoria()
+    logger.info('Dados %s carregados em %.3f s (df_cursos: %.2f MB, prog_aulas_curso: %.2f MB)',
+                dados.versao, dados.tempo_carga, memoria['df_cursos'] / 1e6, memoria['prog_aulas_curso'] / 1e6)
+    return dados
+
+
+_dados = None
+_trava = threading.Lock()
+_ao_recarregar = []
+# Versão fixada por fixar_dados() no contexto atual (por thread/requisição)
+_dados_fixados = contextvars.ContextVar('painel_dados_fixados', default=None)
+
+
+def obter_dados():
+    # Carrega os CSVs na primeira chamada; depois devolve a versão atual, sem trava
+    # (a recarga só troca a referência). Chamar a cada uso, não guardar em variável de módulo.
+    global _dados
+    fixados = _dados_fixados.get()
+    if fixados is not None:
+        return fixados
+    if _dados is None:
+        with _trava:
+            if _dados is None:
+                _dados = carregar_dados()
+    return _dados
+
+
+@contextmanager
+def fixar_dados():
+    # Dentro do bloco (ou da função decorada com @fixar_dados()), obter_dados() devolve sempre a
+    # mesma versão: uma recarga no meio de um callback não mistura duas versões numa figura.
+    # Blocos aninhados herdam a versão do externo
+    dados = obter_dados()
+    token = _dados_fixados.set(dados)
+    try:
+        yield dados
+    finally:
+        _dados_fixados.reset(token)
+
+
+def ao_recarregar(funcao):
+    # `funcao(dados)` é chamada (na thread da recarga) depois de cada nova versão
+    _ao_recarregar.append(funcao)
+    return funcao
+
+
+def recarregar_se_mudou():
+    global _dados
+    atual = obter_dados()
+    if versao_arquivos(ARQUIVO_CURSOS, ARQUIVO_PROGRESSO) == atual.versao:
+        return False
+    # Carga e tabelas derivadas fora da trava: as requisições seguem com a versão atual até a troca
+    novos = carregar_dados()
+    with _trava:
+        _dados = novos
+    logger.info('Dados recarregados: versão %s -> %s', atual.versao, novos.versao)
+    for funcao in _ao_recarregar:
+        try:
+            funcao(novos)
+        except Exception:
+            logger.warning('Falha em %s após a recarga', funcao.__name__, exc_info=True)
+    return True
+
+
+def _estado_arquivos():
+    try:
+        return tuple((info.st_mtime_ns, info.st_size)
+                     for info in (ARQUIVO_CURSOS.stat(), ARQUIVO_PROGRESSO.stat()))
+    except FileNotFoundError:
+        return None
+
+
+def _observar(intervalo):
+    visto = anterior = _estado_arquivos()
+    while True:
+        time.sleep(intervalo)
+        estado = _estado_arquivos()
+        # Só recarrega arquivos parados por um intervalo inteiro: uma cópia em andamento
+        # seria lida pela metade
+        if estado is None or estado == visto or estado != anterior:
+            anterior = estado
+            continue
+        visto = estado
+        try:
+            recarregar_se_mudou()
+        except Exception:
+            logger.warning('Recarga dos dados falhou, mantida a versão %s', obter_dados().versao, exc_info=True)
+
+
+def observar_arquivos(intervalo=RECARGA_INTERVALO):
+    if not intervalo:
+        return None
+    thread = threading.Thread(target=_observar, args=(intervalo,), name='painel-recarga', daemon=True)
+    thread.start()
+    return thread
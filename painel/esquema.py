@@ -0,0 +1,74 @@
+import hashlib
+
+import pandas as pd
+
+from painel.cursos import CURSOS as TABELA_CURSOS
+
+# Domínios fechados: qualquer valor fora destas listas indica um CSV inesperado
+CURSOS = [curso.nome for curso in TABELA_CURSOS]
+STATUS = ['CONCLUÍDA', 'EM ANDAMENTO', 'PENDENTE']
+
+# Tipos por coluna. Categorias com lista fixa são validadas; 'category' sem lista aceita qualquer texto.
+# As categorias ficam em ordem alfabética, como as strings ordenavam antes nos groupbys.
+ESQUEMA_CURSOS = {
+    'ID': 'category',
+    'Subtarefa': 'category',
+    'Responsável': 'category',
+    'data inicial': 'datetime64[ns]',
+    'data final': 'datetime64[ns]',
+    'dif': 'float32',
+    'progresso': 'float32',
+    'curso': pd.CategoricalDtype(sorted(CURSOS)),
+    'Ordem da aula': 'float32',
+    'Módulo': 'category',
+    'Aula': 'category',
+    'Professor': 'category',
+    'Status': pd.CategoricalDtype(sorted(STATUS)),
+    'Duração': 'float32',
+}
+
+ESQUEMA_PROGRESSO = {
+    'data final': 'datetime64[ns]',
+    'curso': pd.CategoricalDtype(sorted(CURSOS)),
+    'Módulo': 'category',
+    'Aula': 'category',
+    'progresso_100': 'int8',
+    'progresso_acumulado': 'int32',
+}
+
+
+class ErroEsquema(ValueError):
+    pass
+
+
+def versao_esquema():
+    # Entra na chave do cache de dados: mudar o esquema invalida os arquivos já gerados
+    descricao = repr(sorted((nome, str(tipo), repr(getattr(tipo, 'categories', None)))
+                            for esquema in (ESQUEMA_CURSOS, ESQUEMA_PROGRESSO)
+                            for nome, tipo in esquema.items()))
+    return hashlib.blake2b(descricao.encode(), digest_size=4).hexdigest()
+
+
+def _converter(serie, tipo):
+    if tipo == 'datetime64[ns]':
+        return pd.to_datetime(serie, format='ISO8601')
+    if isinstance(tipo, pd.CategoricalDtype):
+        inesperados = set(serie.dropna().unique()) - set(tipo.categories)
+        if inesperados:
+            raise ErroEsquema(f'valores inesperados: {sorted(inesperados)}')
+    return serie.astype(tipo)
+
+
+def aplicar_esquema(df, esquema, nome):
+    faltando = [coluna for coluna in esquema if coluna not in df.columns]
+    if faltando:
+        raise ErroEsquema(f'{nome}: colunas ausentes {faltando}')
+
+    for coluna, tipo in esquema.items():
+        try:
+            df[coluna] = _converter(df[coluna], tipo)
+        except ErroEsquema as erro:
+            raise ErroEsquema(f'{nome}: coluna {coluna!r} com {erro}') from None
+        except (ValueError, TypeError) as erro:
+            raise ErroEsquema(f'{nome}: coluna {coluna!r} incompatível com {tipo}: {erro}') from erro
+    return df
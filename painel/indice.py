@@ -0,0 +1,79 @@
+import numpy as np
+
+# Colunas de df_cursos (e do resumo por aula, quando existem lá) com filtro multi-seleção
+COLUNAS_INDICE = ('Módulo', 'Responsável', 'Professor')
+
+_VAZIO = np.empty(0, dtype=np.int64)
+
+
+class ErroFiltro(ValueError):
+    pass
+
+
+def _posicoes_por_valor(coluna):
+    # Valor -> posições (crescentes) das linhas com esse valor, a partir dos códigos da categoria;
+    # linhas sem valor (código -1) ficam fora
+    codigos = coluna.cat.codes.to_numpy()
+    ordem = np.argsort(codigos, kind='stable')
+    presentes, inicios = np.unique(codigos[ordem], return_index=True)
+    categorias = coluna.cat.categories
+    return {categorias[codigo]: posicoes
+            for codigo, posicoes in zip(presentes, np.split(ordem, inicios[1:]))
+            if codigo >= 0}
+
+
+class IndiceInvertido:
+    # Índice invertido das colunas categóricas de um DataFrame: um filtro vira a união das posições
+    # dos valores selecionados (e a interseção entre colunas), sem varrer nem comparar as colunas
+
+    def __init__(self, df, colunas=COLUNAS_INDICE):
+        self._posicoes = {coluna: _posicoes_por_valor(df[coluna]) for coluna in colunas if coluna in df}
+
+    def indexada(self, coluna):
+        return coluna in self._posicoes
+
+    def posicoes(self, filtros):
+        # Posições crescentes (mantêm a ordem das linhas) ou None sem nenhum filtro ativo
+        resultado = None
+        for coluna, valores in filtros.items():
+            if not valores:
+                continue
+            por_valor = self._posicoes.get(coluna)
+            if por_valor is None:
+                raise ErroFiltro(f'Filtro pela coluna {coluna!r} sem índice (indexadas: {", ".join(self._posicoes)})')
+            partes = [por_valor[valor] for valor in set(valores) if valor in por_valor]
+            selecao = np.sort(np.concatenate(partes)) if partes else _VAZIO
+            resultado = selecao if resultado is None else np.intersect1d(resultado, selecao, assume_unique=True)
+        return resultado
+
+    def filtrar(self, df, filtros):
+        posicoes = self.posicoes(filtros)
+        return df if posicoes is None else df.iloc[posicoes]
+
+
+class IndiceResumo(IndiceInvertido):
+    # Índice do resumo por aula (uma linha por ID). Colunas que só existem nas linhas de df_cursos
+    # (Responsável) são resolvidas no índice das linhas do curso e levadas às aulas pelo ID:
+    # fica a aula com ao menos uma subtarefa que atende ao filtro
+
+    def __init__(self, resumo, linhas, indice_linhas, colunas=COLUNAS_INDICE):
+        super().__init__(resumo, colunas)
+        self._indice_linhas = indice_linhas
+        categorias = linhas['ID'].cat.categories
+        self._ids_linhas = linhas['ID'].cat.codes.to_numpy()
+        # Código do ID (nas categorias de df_cursos) -> posição da aula no resumo, -1 sem aula
+        codigos = resumo['ID'].cat.set_categories(categorias).cat.codes.to_numpy()
+        self._posicao_por_id = np.full(len(categorias), -1, dtype=np.int64)
+        self._posicao_por_id[codigos[codigos >= 0]] = np.flatnonzero(codigos >= 0)
+
+    def posicoes(self, filtros):
+        proprios = {coluna: valores for coluna, valores in filtros.items() if self.indexada(coluna)}
+        resultado = super().posicoes(proprios)
+        linhas = self._indice_linhas.posicoes({coluna: valores for coluna, valores in filtros.items()
+                                               if coluna not in proprios})
+        if linhas is None:
+            return resultado
+        codigos = np.unique(self._ids_linhas[linhas])
+        selecao = self._posicao_por_id[codigos[codigos >= 0]]
+        selecao = np.sort(selecao[selecao >= 0])
+        return selecao if resultado is None else np.intersect1d(resultado, selecao, assume_unique=True)
@@ -0,0 +1,191 @@
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+import numpy as np
+from dash import ctx
+from dash.exceptions import PreventUpdate
+from flask import g, has_request_context, request
+
+logger = logging.getLogger(__name__)
+
+# Métricas por callback e etapa, expostas em /metrics (formato texto do Prometheus).
+# PAINEL_METRICAS=0 desliga a coleta (etapa() vira um contexto vazio); os logs de tempo continuam.
+# Os valores são do processo: com vários workers do gunicorn, cada coleta vê um deles.
+HABILITADO = os.environ.get('PAINEL_METRICAS', '1') != '0'
+# PAINEL_METRICAS_PAGINA=1 registra a página de depuração /metricas (tabela das mesmas séries)
+PAGINA = HABILITADO and os.environ.get('PAINEL_METRICAS_PAGINA', '0') == '1'
+
+# Etapas de uma requisição de callback:
+#   callback     tempo dentro da função do callback
+#   cache        leitura/gravação no cache de figuras
+#   construcao   montagem das figuras que faltavam no cache, que se divide em
+#     dados        filtros e agregações do pandas
+#     figura       plotly (construcao - dados - serializacao)
+#     serializacao compactar_figura
+#   resposta     fora do callback: codificação JSON do Dash e o resto do framework
+#   requisicao   total
+AMOSTRAS = 1000  # por série, para os quantis
+QUANTIS = (0.5, 0.9, 0.99)
+
+_series = {}
+_trava = threading.Lock()
+_sem_etapa = nullcontext()
+
+
+class _Serie:
+    def __init__(self):
+        self.amostras = deque(maxlen=AMOSTRAS)
+        self.contagem = 0
+        self.soma = 0.0
+
+
+def registrar(metrica, valor, **rotulos):
+    chave = (metrica, tuple(sorted(rotulos.items())))
+    with _trava:
+        serie = _series.get(chave)
+        if serie is None:
+            serie = _series[chave] = _Serie()
+        serie.amostras.append(valor)
+        serie.contagem += 1
+        serie.soma += valor
+
+
+def _acumular(nome, duracao):
+    # Dentro de um callback soma na requisição (uma amostra por etapa ao final);
+    # fora dele (scripts, benchmarks) registra direto
+    if has_request_context() and 'etapas' in g:
+        g.etapas[nome] = g.etapas.get(nome, 0.0) + duracao
+    else:
+        registrar('painel_etapa_segundos', duracao, callback='-', etapa=nome)
+
+
+@contextmanager
+def _medir_etapa(nome):
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        _acumular(nome, time.perf_counter() - inicio)
+
+
+def etapa(nome):
+    return _medir_etapa(nome) if HABILITADO else _sem_etapa
+
+
+def _disparo():
+    # Componente que disparou o callback (None na carga da página)
+    try:
+        disparo = ctx.triggered_id
+    except Exception:
+        return None
+    if isinstance(disparo, dict):
+        return '/'.join(str(valor) for valor in disparo.values())
+    return disparo
+
+
+def cronometrar(funcao):
+    # Log do tempo de cada execução do callback, com o que o disparou e se houve atualização;
+    # com as métricas ligadas, também abre a contagem das etapas da requisição
+    nome = funcao.__name__
+
+    @wraps(funcao)
+    def cronometrada(*args, **kwargs):
+        medir = HABILITADO and has_request_context()
+        if medir:
+            g.callback_painel = nome
+            g.etapas = {}
+        inicio = time.perf_counter()
+        resultado = 'atualizado'
+        try:
+            return funcao(*args, **kwargs)
+        except PreventUpdate:
+            resultado = 'sem atualização'
+            raise
+        finally:
+            duracao = time.perf_counter() - inicio
+            if medir:
+                g.etapas['callback'] = duracao
+            logger.info('Callback %s (%s): %s em %.1f ms', nome, _disparo(), resultado, duracao * 1000)
+    return cronometrada
+
+
+def configurar_metricas(server):
+    if not HABILITADO:
+        return
+
+    @server.before_request
+    def iniciar_requisicao():
+        g.inicio_requisicao = time.perf_counter()
+
+    # Registrado depois de configurar_respostas, roda antes dele: o tamanho medido é o da
+    # resposta sem compressão
+    @server.after_request
+    def registrar_requisicao(response):
+        nome = g.get('callback_painel')
+        if nome is None or 'inicio_requisicao' not in g:
+            return response
+        etapas = g.etapas
+        etapas['requisicao'] = time.perf_counter() - g.inicio_requisicao
+        etapas['resposta'] = etapas['requisicao'] - etapas.get('callback', 0.0)
+        if 'construcao' in etapas:
+            etapas['figura'] = etapas['construcao'] - etapas.get('dados', 0.0) - etapas.get('serializacao', 0.0)
+        for nome_etapa, duracao in etapas.items():
+            registrar('painel_callback_segundos', duracao, callback=nome, etapa=nome_etapa)
+        if response.status_code == 200 and request.path.endswith('_dash-update-component'):
+            registrar('painel_resposta_bytes', len(response.get_data()), callback=nome)
+        return response
+
+
+def resumo():
+    # Linhas (métrica, rótulos, contagem, soma, quantis) de cada série, para /metrics e a página de depuração
+    with _trava:
+        series = [(metrica, dict(rotulos), serie.contagem, serie.soma, np.array(serie.amostras))
+                  for (metrica, rotulos), serie in sorted(_series.items())]
+    return [(metrica, rotulos, contagem, soma, dict(zip(QUANTIS, np.quantile(amostras, QUANTIS))))
+            for metrica, rotulos, contagem, soma, amostras in series]
+
+
+def _rotulos(rotulos):
+    return '{' + ','.join(f'{nome}="{str(valor)}"' for nome, valor in rotulos.items()) + '}' if rotulos else ''
+
+
+def texto_prometheus(estatisticas_cache=None, dados=None):
+    linhas = []
+    tipos_vistos = set()
+    descricoes = {
+        'painel_callback_segundos': 'Duração por callback e etapa (segundos)',
+        'painel_resposta_bytes': 'Tamanho da resposta do callback, sem compressão (bytes)',
+        'painel_etapa_segundos': 'Etapas medidas fora de callbacks (segundos)',
+    }
+    for metrica, rotulos, contagem, soma, quantis in resumo():
+        if metrica not in tipos_vistos:
+            tipos_vistos.add(metrica)
+            linhas.append(f'# HELP {metrica} {descricoes.get(metrica, metrica)}')
+            linhas.append(f'# TYPE {metrica} summary')
+        for quantil, valor in quantis.items():
+            linhas.append(f'{metrica}{_rotulos({**rotulos, "quantile": quantil})} {valor:.6g}')
+        linhas.append(f'{metrica}_sum{_rotulos(rotulos)} {soma:.6g}')
+        linhas.append(f'{metrica}_count{_rotulos(rotulos)} {contagem}')
+
+    if estatisticas_cache:
+        linhas.append('# HELP painel_cache_figuras_total Consultas ao cache de figuras por resultado')
+        linhas.append('# TYPE painel_cache_figuras_total counter')
+        for funcao, contadores in sorted(estatisticas_cache.items()):
+            for resultado, chave in (('acerto', 'acertos'), ('falta', 'faltas')):
+                linhas.append(f'painel_cache_figuras_total{_rotulos({"funcao": funcao, "resultado": resultado})} '
+                              f'{contadores[chave]}')
+
+    if dados is not None:
+        linhas.append('# HELP painel_dados_carga_segundos Tempo de carga dos dados neste processo')
+        linhas.append('# TYPE painel_dados_carga_segundos gauge')
+        linhas.append(f'painel_dados_carga_segundos{_rotulos({"versao": dados.versao})} {dados.tempo_carga:.6g}')
+        linhas.append('# HELP painel_dados_bytes Memória ocupada por dataset')
+        linhas.append('# TYPE painel_dados_bytes gauge')
+        for dataset, tamanho in dados.memoria().items():
+            linhas.append(f'painel_dados_bytes{_rotulos({"dataset": dataset})} {tamanho}')
+    return '\n'.join(linhas) + '\n'
@@ -0,0 +1,99 @@
+import gzip
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # opcional: sem o pacote, só gzip
+    brotli = None
+
+# Compressão das respostas (callbacks, layout, JS/CSS) e cache dos arquivos estáticos no navegador.
+# PAINEL_COMPRESSAO: codificações na ordem de preferência ('' desliga); só comprime a partir de
+# PAINEL_COMPRESSAO_MINIMO bytes, abaixo disso o ganho não paga o custo.
+COMPRESSAO = [codificacao for codificacao in os.environ.get('PAINEL_COMPRESSAO', 'br,gzip').split(',') if codificacao]
+COMPRESSAO_MINIMO = int(os.environ.get('PAINEL_COMPRESSAO_MINIMO', 1024))
+
+TIPOS_COMPRIMIVEIS = ('application/json', 'application/javascript', 'text/')
+
+# Arquivos com impressão digital na URL (?m= do Dash, ?v= de url_asset) nunca mudam de conteúdo
+CACHE_ESTATICOS = 'public, max-age=31536000, immutable'
+
+_compressores = {'gzip': lambda dados: gzip.compress(dados, compresslevel=6)}
+if brotli is not None:
+    _compressores['br'] = lambda dados: brotli.compress(dados, quality=5)
+
+# Versões já comprimidas dos estáticos (JS do Dash, assets), por URL, ETag e codificação:
+# a URL com impressão digital ou a ETag garantem que o conteúdo é o mesmo
+_LIMITE_ESTATICOS = 64
+_estaticos = OrderedDict()
+_trava = threading.Lock()
+
+
+def _comprimir(response, codificacao):
+    etag = response.get_etag()[0]
+    imutavel = 'max-age=31536000' in (response.headers.get('Cache-Control') or '')
+    if not (etag or imutavel):
+        return _compressores[codificacao](response.get_data())
+
+    chave = (request.full_path, etag, codificacao)
+    with _trava:
+        if chave in _estaticos:
+            _estaticos.move_to_end(chave)
+            return _estaticos[chave]
+    comprimido = _compressores[codificacao](response.get_data())
+    with _trava:
+        _estaticos[chave] = comprimido
+        if len(_estaticos) > _LIMITE_ESTATICOS:
+            _estaticos.popitem(last=False)
+    return comprimido
+
+
+def cache_estaticos(response):
+    if request.path.startswith('/assets/') and ('m' in request.args or 'v' in request.args):
+        response.headers['Cache-Control'] = CACHE_ESTATICOS
+    return response
+
+
+def comprimir_resposta(response):
+    disponiveis = [codificacao for codificacao in COMPRESSAO if codificacao in _compressores]
+    if (not disponiveis
+            or response.status_code != 200
+            or 'Content-Encoding' in response.headers
+            or 'Range' in request.headers
+            or not (response.mimetype or '').startswith(TIPOS_COMPRIMIVEIS)):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    codificacao = request.accept_encodings.best_match(disponiveis)
+    if codificacao is None:
+        return response
+
+    if response.content_length is not None and response.content_length < COMPRESSAO_MINIMO:
+        return response
+
+    # Arquivos estáticos saem em streaming; para comprimir, o conteúdo precisa ser lido
+    response.direct_passthrough = False
+    response.set_data(_comprimir(response, codificacao))
+    # A ETag é mantida: o Dash e o Flask a comparam literalmente nas revalidações (304),
+    # e o Vary separa as representações nos caches intermediários
+    response.headers['Content-Encoding'] = codificacao
+    return response
+
+
+def configurar_respostas(server):
+    @server.after_request
+    def ajustar_resposta(response):
+        # Cabeçalho de cache antes da compressão: os estáticos imutáveis têm a versão comprimida guardada
+        return comprimir_resposta(cache_estaticos(response))
+
+
+def url_asset(app, caminho):
+    # URL de um arquivo de assets/ com o hash do conteúdo (?v=): fica em cache no navegador por um ano
+    # e muda sozinha quando o arquivo muda
+    versao = hashlib.blake2b((Path(app.config.assets_folder) / caminho).read_bytes(), digest_size=6).hexdigest()
+    return f'{app.get_asset_url(caminho)}?v={versao}'
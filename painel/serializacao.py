@@ -0,0 +1,77 @@
+import base64
+import os
+
+import numpy as np
+import pandas as pd
+from dash import ClientsideFunction, Input, Output, clientside_callback
+
+from painel.metricas import etapa
+
+# Figuras compactas: customdata com texto repetido (Módulo, Aula, Responsável...) vira códigos inteiros
+# + lista de categorias por coluna, expandidos por assets/js/figuras.js; arrays numéricos longos viram
+# typed arrays do plotly.js ({dtype, bdata}, base64), lidos direto pelo navegador.
+# Datas e arrays numéricos curtos ficam como listas: com o gzip das respostas (painel/respostas.py),
+# base64 comprime pior que o texto (datas ISO, números pequenos) e a figura ficaria maior na rede.
+# O servidor grava a figura compacta num dcc.Store e um callback no navegador a entrega ao dcc.Graph.
+
+# Pontos a partir dos quais x/y/base numéricos vão como typed array
+MINIMO_TYPED = int(os.environ.get('PAINEL_MINIMO_TYPED', 1000))
+
+# Tipos aceitos pelo plotly.js em typed arrays (int64 não está entre eles)
+_TIPOS = {
+    np.dtype('int8'): 'i1', np.dtype('uint8'): 'u1',
+    np.dtype('int16'): 'i2', np.dtype('uint16'): 'u2',
+    np.dtype('int32'): 'i4', np.dtype('uint32'): 'u4',
+    np.dtype('float32'): 'f4', np.dtype('float64'): 'f8',
+}
+
+
+def typed_array(valores, shape=None):
+    valores = np.ascontiguousarray(valores, dtype=valores.dtype.newbyteorder('<'))
+    typed = {'dtype': _TIPOS[valores.dtype], 'bdata': base64.b64encode(valores.tobytes()).decode('ascii')}
+    if shape is not None:
+        typed['shape'] = ','.join(map(str, shape))
+    return typed
+
+
+def _numerico(valores):
+    if valores.dtype == np.int64 or valores.dtype == np.uint64:
+        pequeno = valores.size == 0 or (valores.min() >= np.iinfo(np.int32).min and valores.max() <= np.iinfo(np.int32).max)
+        valores = valores.astype(np.int32 if pequeno else np.float64)
+    return typed_array(valores)
+
+
+def _dicionario(valores):
+    colunas = valores.reshape(len(valores), -1)
+    categorias, codigos = [], np.empty(colunas.shape, dtype=np.int32)
+    for j in range(colunas.shape[1]):
+        codigos[:, j], unicos = pd.factorize(colunas[:, j])
+        categorias.append(unicos.tolist())
+    tipo = np.int16 if max(map(len, categorias), default=0) < np.iinfo(np.int16).max else np.int32
+    return {'categorias': categorias, 'codigos': typed_array(codigos.astype(tipo), shape=valores.shape)}
+
+
+def compactar_figura(figura):
+    with etapa('serializacao'):
+        figura = figura.to_dict()
+        for trace in figura['data']:
+            for atributo in ('x', 'y', 'base'):
+                valores = trace.get(atributo)
+                if not isinstance(valores, np.ndarray) or valores.size < MINIMO_TYPED:
+                    continue
+                if valores.dtype in _TIPOS or valores.dtype in (np.int64, np.uint64):
+                    trace[atributo] = _numerico(valores)
+
+            customdata = trace.get('customdata')
+            if isinstance(customdata, np.ndarray) and customdata.dtype == object and customdata.size:
+                trace['customdata'] = _dicionario(customdata)
+        return figura
+
+
+def expandir_no_navegador(grafico, figura):
+    # Liga o dcc.Store `figura` (figura compacta vinda do servidor) ao dcc.Graph `grafico`
+    clientside_callback(
+        ClientsideFunction(namespace='painel', function_name='expandir_figura'),
+        Output(grafico, 'figure'),
+        Input(figura, 'data'),
+    )
@@ -0,0 +1,67 @@
+import pandas as pd
+
+# Os datasets de Dados são compartilhados por todas as requisições (e threads) do worker: os callbacks
+# leem as tabelas e fatias sem copiar, e qualquer escrita nelas é um erro em vez de uma corrupção
+# silenciosa. Quem precisar de uma coluna nova monta a própria tabela (assign, groupby, ...).
+
+
+class ErroSomenteLeitura(ValueError):
+    pass
+
+
+def _erro(operacao):
+    return ErroSomenteLeitura(f'{operacao}: tabela compartilhada dos dados é somente leitura; '
+                              'use assign() ou copy() para uma tabela própria')
+
+
+class TabelaSomenteLeitura(pd.DataFrame):
+    # Bloqueia as mudanças de estrutura (colunas, eixos, inplace=True, linhas novas pelo loc); as escritas
+    # de valores (loc/iloc/at, .values) já falham pelos arrays marcados como não graváveis.
+    # Filtros, fatias e agregações devolvem DataFrames comuns, sem cópia quando o pandas usa visões.
+
+    @property
+    def _constructor(self):
+        return pd.DataFrame
+
+    def __setitem__(self, chave, valor):
+        raise _erro(f'df[{chave!r}] = ...')
+
+    def __delitem__(self, chave):
+        raise _erro(f'del df[{chave!r}]')
+
+    def isetitem(self, posicao, valor):
+        # Também o caminho do loc/iloc que substitui uma coluna inteira
+        raise _erro(f'df.isetitem({posicao!r}, ...)')
+
+    def insert(self, *args, **kwargs):
+        raise _erro('insert')
+
+    def _update_inplace(self, *args, **kwargs):
+        raise _erro('inplace=True')
+
+    def __setattr__(self, nome, valor):
+        # O pandas reatribui _mgr ao crescer pelo loc; a consolidação reatribui o mesmo objeto
+        if nome in ('index', 'columns') or (nome == '_mgr' and valor is not self.__dict__.get('_mgr')):
+            raise _erro(f'df.{nome} = ...')
+        super().__setattr__(nome, valor)
+
+
+def _congelar_arrays(gerenciador):
+    for bloco in gerenciador.blocks:
+        # Categorical, datas e durações guardam um ndarray em _ndarray (códigos, int64)
+        getattr(bloco.values, '_ndarray', bloco.values).setflags(write=False)
+
+
+def somente_leitura(objeto):
+    # DataFrame -> TabelaSomenteLeitura sobre os mesmos arrays; Series e dicts de tabelas também
+    if isinstance(objeto, dict):
+        return {chave: somente_leitura(valor) for chave, valor in objeto.items()}
+    if isinstance(objeto, pd.DataFrame):
+        # Consolidado antes: a consolidação tardia trocaria os blocos por arrays graváveis
+        objeto = objeto._consolidate()
+        tabela = TabelaSomenteLeitura(objeto)
+        _congelar_arrays(tabela._mgr)
+        return tabela
+    if isinstance(objeto, pd.Series):
+        _congelar_arrays(objeto._mgr)
+    return objeto